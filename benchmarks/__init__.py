@@ -0,0 +1,13 @@
+"""
+Throughput benchmarks for the combat and persistence hot paths
+
+Run with python -m benchmarks. Every case uses fixed seeds, results are
+written as JSON, and a stored baseline can be compared against with a
+regression threshold. Cold-start import times of the entry modules are
+checked against fixed budgets as well.
+"""
+
+from benchmarks.runner import compare_to_baseline, run_benchmarks
+from benchmarks.startup import check_startup
+
+__all__ = ["check_startup", "compare_to_baseline", "run_benchmarks"]
@@ -0,0 +1,57 @@
+import argparse
+import json
+import sys
+from benchmarks.cases import ROSTER_SIZES
+from benchmarks.runner import compare_to_baseline, load_report, run_benchmarks
+from benchmarks.startup import check_startup
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the combat and persistence hot paths")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in ROSTER_SIZES),
+                        help="comma-separated roster sizes for the persistence cases")
+    parser.add_argument("--quick", action="store_true",
+                        help="only use the smallest roster size")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per benchmark; the best one is reported")
+    parser.add_argument("--filter", dest="name_filter",
+                        help="only run benchmarks whose name contains this text")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare against a stored JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown vs the baseline (0.10 = 10%%)")
+    parser.add_argument("--skip-startup", action="store_true",
+                        help="do not check cold-start import times against their budget")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    if args.quick:
+        sizes = sizes[:1]
+
+    def progress(name, result):
+        print(f"{name:45} {result['seconds_per_op'] * 1e6:12.3f} us/op", file=sys.stderr)
+
+    report = run_benchmarks(sizes, args.repeat, args.name_filter, progress)
+    status = 0
+    if not args.skip_startup:
+        report["startup"] = check_startup()
+        if report["startup"]["over_budget"]:
+            status = 1
+    if args.baseline:
+        report["comparison"] = compare_to_baseline(
+            report, load_report(args.baseline), args.threshold)
+        if report["comparison"]["regressions"]:
+            status = 1
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import os
+import random
+import tempfile
+from typing import Callable, Iterator, List, Tuple
+from models import Character, Combatant
+from character_manager import CharacterManager
+from combat_engine import CombatEngine
+from combat_simulation import CombatSimulation
+
+
+# Seed shared by every case, so runs draw identical fights
+SEED = 1234
+
+# Roster sizes used by the persistence cases
+ROSTER_SIZES = (1_000, 100_000, 1_000_000)
+
+# A case yields (name, workload, operations per workload call)
+Case = Iterator[Tuple[str, Callable[[], None], int]]
+
+
+def _hero() -> Character:
+    return Character(name="Hero", level=5, strength=14, dexterity=13, intelligence=10,
+                     wisdom=11, agility=12, constitution=16)
+
+
+def _enemies(count: int) -> List[Character]:
+    rng = random.Random(SEED)
+    return [Character(name=f"Enemy_{i}", strength=rng.randint(6, 12),
+                      dexterity=rng.randint(6, 12), agility=rng.randint(6, 12),
+                      constitution=rng.randint(6, 12))
+            for i in range(1, count + 1)]
+
+
+def attack_cases(sizes) -> Case:
+    """CombatEngine.attack on two combatants"""
+    engine = CombatEngine(random.Random(SEED))
+    engine.detailed_log = False
+    attacker = Combatant(_hero())
+    defender = Combatant(Character(name="Dummy", constitution=20))
+    swings = 10_000
+
+    def workload():
+        engine.rng = random.Random(SEED)
+        for _ in range(swings):
+            defender.current_hp = defender.max_hp
+            engine.attack(attacker, defender)
+
+    yield "combat_engine.attack", workload, swings
+
+
+def turn_order_cases(sizes) -> Case:
+    """CombatEngine.determine_turn_order for a 1v20 fight"""
+    engine = CombatEngine(random.Random(SEED))
+    participants = [Combatant(char) for char in [_hero()] + _enemies(20)]
+    rounds = 2_000
+
+    def workload():
+        engine.rng = random.Random(SEED)
+        for _ in range(rounds):
+            engine.determine_turn_order(participants)
+
+    yield "combat_engine.determine_turn_order[21]", workload, rounds
+
+
+def simulate_combat_cases(sizes) -> Case:
+    """CombatSimulation.simulate_combat, 1v1 and 1v20, detailed and quick log"""
+    manager = CharacterManager()
+    manager.characters["Hero"] = _hero()
+    simulation = CombatSimulation(manager)
+
+    for enemy_count, fights in ((1, 500), (20, 50)):
+        enemies = _enemies(enemy_count)
+        for detailed in (True, False):
+            def workload(enemies=enemies, detailed=detailed, fights=fights):
+                rng = random.Random(SEED)
+                for _ in range(fights):
+                    simulation.simulate_combat("Hero", enemies, detailed_log=detailed, rng=rng)
+
+            log = "detailed" if detailed else "quick"
+            yield f"simulate_combat[1v{enemy_count},{log}]", workload, fights
+
+
+def persistence_cases(sizes) -> Case:
+    """CharacterManager.save_to_file / load_from_file by roster size"""
+    directory = tempfile.mkdtemp(prefix="cadena-bench-")
+    for size in sizes:
+        manager = CharacterManager()
+        manager.create_random_characters("Enemy", size, rng=random.Random(SEED))
+        path = os.path.join(directory, f"roster_{size}.json")
+
+        def save(manager=manager, path=path):
+            manager.save_to_file(path)
+
+        def load(path=path):
+            CharacterManager().load_from_file(path)
+
+        yield f"save_to_file[{size}]", save, size
+        save()
+        yield f"load_from_file[{size}]", load, size
+        os.remove(path)
+    os.rmdir(directory)
+
+
+def creation_cases(sizes) -> Case:
+    """Bulk random character creation, one at a time and batched"""
+    count = min(sizes)
+
+    def one_at_a_time():
+        manager = CharacterManager()
+        rng = random.Random(SEED)
+        for i in range(count):
+            manager.create_random_character(f"Enemy_{i}", rng=rng)
+
+    def batched():
+        CharacterManager().create_random_characters("Enemy", max(sizes),
+                                                    rng=random.Random(SEED))
+
+    yield f"create_random_character[{count}]", one_at_a_time, count
+    yield f"create_random_characters[{max(sizes)}]", batched, max(sizes)
+
+
+CASES = (attack_cases, turn_order_cases, simulate_combat_cases,
+         persistence_cases, creation_cases)
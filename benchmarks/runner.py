@@ -0,0 +1,74 @@
+import json
+import platform
+import statistics
+import time
+from typing import Dict, Iterable, Optional
+from benchmarks.cases import CASES, ROSTER_SIZES, SEED
+
+
+def run_benchmarks(sizes: Iterable[int] = ROSTER_SIZES, repeat: int = 3,
+                   name_filter: Optional[str] = None, progress=None) -> Dict:
+    """
+    Time every benchmark case
+    Each workload runs repeat times; the best run is the headline number
+    since it is the least disturbed by the rest of the machine.
+    Returns a JSON-ready report with per-operation timings
+    """
+    sizes = tuple(sizes)
+    results = {}
+    for case in CASES:
+        for name, workload, operations in case(sizes):
+            if name_filter and name_filter not in name:
+                continue
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                workload()
+                timings.append(time.perf_counter() - start)
+            results[name] = {
+                "operations": operations,
+                "best_seconds": min(timings),
+                "median_seconds": statistics.median(timings),
+                "seconds_per_op": min(timings) / operations,
+                "ops_per_second": operations / min(timings),
+            }
+            if progress is not None:
+                progress(name, results[name])
+
+    return {
+        "seed": SEED,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, threshold: float = 0.10) -> Dict:
+    """
+    Compare a report with a stored baseline report
+    A benchmark regresses when its time per operation grew by more than
+    threshold (0.10 = 10%). Benchmarks missing on either side are skipped.
+    """
+    comparison = {}
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        ratio = result["seconds_per_op"] / base["seconds_per_op"]
+        comparison[name] = {
+            "baseline_seconds_per_op": base["seconds_per_op"],
+            "seconds_per_op": result["seconds_per_op"],
+            "ratio": ratio,
+            "regressed": ratio > 1 + threshold,
+        }
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return {"threshold": threshold, "benchmarks": comparison, "regressions": regressions}
+
+
+def load_report(path: str) -> Dict:
+    """Read a report (or baseline) written by the benchmark CLI"""
+    with open(path, 'r') as f:
+        return json.load(f)
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+
+# Cold-start import budgets in seconds. main and user_interface are what a
+# short-lived process pays before doing any work, so they must stay cheap.
+STARTUP_BUDGETS = {
+    "main": 0.05,
+    "user_interface": 0.05,
+    "combat_simulation": 0.15,
+}
+
+# Directory holding the simulator modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str, runs: int = 5) -> float:
+    """
+    Best cumulative import time of module in fresh interpreters, in seconds
+    Parsed from python -X importtime, which reports microseconds per module.
+    """
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        for line in completed.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if name.strip() == module and not name[1:].startswith(" "):
+                seconds = int(cumulative) / 1e6
+                best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def check_startup(budgets: Optional[Dict[str, float]] = None, runs: int = 5) -> Dict:
+    """Measure every budgeted module and list the ones over budget"""
+    if budgets is None:
+        budgets = STARTUP_BUDGETS
+    modules = {}
+    for module, budget in budgets.items():
+        seconds = import_time(module, runs)
+        modules[module] = {
+            "import_seconds": seconds,
+            "budget_seconds": budget,
+            "over_budget": seconds > budget,
+        }
+    return {
+        "modules": modules,
+        "over_budget": [module for module, result in modules.items() if result["over_budget"]],
+    }
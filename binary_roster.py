@@ -0,0 +1,120 @@
+import mmap
+import struct
+from typing import Dict, Iterator, Optional, Tuple
+from models import Character
+from character_roster import COLUMNS, CharacterRoster
+
+
+# File layout:
+#   header   magic, version, record size, record count, string table offset
+#   records  fixed-width: name offset/length, title offset/length and one
+#            int16 per roster column, in COLUMNS order
+#   strings  UTF-8 names and titles, back to back
+MAGIC = b"CDRS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQ")
+RECORD = struct.Struct("<IHIH" + "h" * len(COLUMNS))
+
+
+def export_binary(roster: CharacterRoster, filename: str):
+    """Write a roster in the fixed-width binary format"""
+    strings = bytearray()
+    offsets: Dict[str, Tuple[int, int]] = {}
+
+    def intern(text: str) -> Tuple[int, int]:
+        # Titles repeat a lot, so identical strings are stored once
+        if text not in offsets:
+            encoded = text.encode("utf-8")
+            offsets[text] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return offsets[text]
+
+    count = len(roster)
+    records = bytearray(RECORD.size * count)
+    columns = [roster.columns[field] for field in COLUMNS]
+    for row, (name, title) in enumerate(zip(roster.names, roster.titles)):
+        name_offset, name_length = intern(name)
+        title_offset, title_length = intern(title)
+        RECORD.pack_into(records, row * RECORD.size,
+                         name_offset, name_length, title_offset, title_length,
+                         *(column[row] for column in columns))
+
+    string_table_offset = HEADER.size + len(records)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, string_table_offset))
+        f.write(records)
+        f.write(strings)
+
+
+class BinaryRoster:
+    """
+    Read-only, memory-mapped view of a binary roster file
+    Records are decoded on access by index, so opening a file costs the
+    same no matter how many characters it holds.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_size, count, strings_offset = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._map.close()
+            raise ValueError(f"{filename} is not a version {VERSION} binary roster")
+        self.count = count
+        self._strings_offset = strings_offset
+        self._name_index: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> 'BinaryRoster':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file"""
+        self._map.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def record(self, index: int) -> Tuple[str, str, Tuple[int, ...]]:
+        """Get character index as a (name, title, column values) record"""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        fields = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        name_offset, name_length, title_offset, title_length = fields[:4]
+        return (self._string(name_offset, name_length),
+                self._string(title_offset, title_length),
+                fields[4:])
+
+    def __getitem__(self, index: int) -> Character:
+        name, title, values = self.record(index)
+        return Character(name=name, title=title, **dict(zip(COLUMNS, values)))
+
+    def __iter__(self) -> Iterator[Tuple[str, str, Tuple[int, ...]]]:
+        for index in range(self.count):
+            yield self.record(index)
+
+    def find(self, name: str) -> Optional[int]:
+        """Get the index of a character by name (builds a name index on first use)"""
+        if self._name_index is None:
+            self._name_index = {}
+            for index in range(self.count):
+                offset = HEADER.size + index * RECORD.size
+                name_offset, name_length = struct.unpack_from("<IH", self._map, offset)
+                self._name_index[self._string(name_offset, name_length)] = index
+        return self._name_index.get(name)
+
+    def as_numpy(self):
+        """Zero-copy structured NumPy view of all records (requires NumPy)"""
+        import numpy as np
+        dtype = np.dtype([('name_offset', '<u4'), ('name_length', '<u2'),
+                          ('title_offset', '<u4'), ('title_length', '<u2')]
+                         + [(field, '<i2') for field in COLUMNS])
+        return np.frombuffer(self._map, dtype=dtype, count=self.count, offset=HEADER.size)
@@ -170,10 +170,8 @@ class CharacterCreation:
             level_min = self.ui.get_int_input("Minimum level: ", 1, 20)
             level_max = self.ui.get_int_input("Maximum level: ", level_min, 20)
 
-            for i in range(1, count + 1):
-                enemy_name = f"{base_name}_{i}"
-                manager.create_random_character(
-                    enemy_name, (stat_min, stat_max), (level_min, level_max)
-                )
+            manager.create_random_characters(
+                base_name, count, (stat_min, stat_max), (level_min, level_max)
+            )
 
             print(f"\nCreated {count} random {base_name} enemies!")
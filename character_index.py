@@ -0,0 +1,137 @@
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple, Union
+from character_roster import STAT_FIELDS, CharacterRoster
+
+
+# Fields that get a secondary index
+INDEXED_FIELDS = ('level',) + STAT_FIELDS
+
+# A query bound: exact value, or (low, high) with None for an open end
+Bound = Union[int, Tuple[Optional[int], Optional[int]]]
+
+
+class StatIndex:
+    """
+    Sorted (value, name) index over one roster column
+
+    The index is built by a single sort the first time it is queried and
+    then kept up to date one change at a time with bisect. Invalidating it
+    (e.g. after loading a new roster) defers the work to the next query.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.entries: List[Tuple[int, str]] = []
+        self.built = False
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt on the next query"""
+        self.entries = []
+        self.built = False
+
+    def build(self, roster: CharacterRoster):
+        """Rebuild the index from the roster columns"""
+        self.entries = sorted(zip(roster.columns[self.field], roster.names))
+        self.built = True
+
+    def add(self, value: int, name: str):
+        if self.built:
+            insort(self.entries, (value, name))
+
+    def extend(self, entries: List[Tuple[int, str]]):
+        if self.built:
+            # Sorting the appended run merges it in close to linear time
+            self.entries.extend(entries)
+            self.entries.sort()
+
+    def remove(self, value: int, name: str):
+        if self.built:
+            position = bisect_left(self.entries, (value, name))
+            del self.entries[position]
+
+    def span(self, low: Optional[int], high: Optional[int]) -> Tuple[int, int]:
+        """Positions of the entries with low <= value <= high"""
+        start = 0 if low is None else bisect_left(self.entries, (low,))
+        stop = len(self.entries) if high is None else bisect_left(self.entries, (high + 1,))
+        return start, max(start, stop)
+
+
+class RosterIndexes:
+    """Secondary indexes on level and every base stat of a roster"""
+
+    def __init__(self):
+        self.indexes = {field: StatIndex(field) for field in INDEXED_FIELDS}
+
+    def invalidate(self):
+        for index in self.indexes.values():
+            index.invalidate()
+
+    def character_added(self, roster: CharacterRoster, name: str):
+        row = roster.index[name]
+        for field, index in self.indexes.items():
+            index.add(roster.columns[field][row], name)
+
+    def characters_added(self, roster: CharacterRoster, names: List[str]):
+        built = [(field, index) for field, index in self.indexes.items() if index.built]
+        if not built:
+            return
+        rows = [roster.index[name] for name in names]
+        for field, index in built:
+            column = roster.columns[field]
+            index.extend([(column[row], name) for row, name in zip(rows, names)])
+
+    def character_removed(self, roster: CharacterRoster, name: str):
+        row = roster.index[name]
+        for field, index in self.indexes.items():
+            index.remove(roster.columns[field][row], name)
+
+    def character_renamed(self, roster: CharacterRoster, old_name: str, new_name: str):
+        row = roster.index[new_name]
+        for field, index in self.indexes.items():
+            value = roster.columns[field][row]
+            index.remove(value, old_name)
+            index.add(value, new_name)
+
+    def value_changed(self, name: str, field: str, old_value, new_value):
+        index = self.indexes.get(field)
+        if index is not None:
+            index.remove(old_value, name)
+            index.add(new_value, name)
+
+    def query(self, roster: CharacterRoster, **bounds: Bound) -> List[str]:
+        """
+        Names of the characters matching every bound
+        The most selective index drives the search and the other bounds are
+        checked against the roster columns directly.
+        """
+        ranges = []
+        for field, bound in bounds.items():
+            if field not in self.indexes:
+                raise ValueError(f"Cannot query on {field}")
+            low, high = (bound, bound) if isinstance(bound, int) else bound
+            ranges.append((field, low, high))
+        if not ranges:
+            return list(roster.names)
+
+        spans = []
+        for field, low, high in ranges:
+            index = self.indexes[field]
+            if not index.built:
+                index.build(roster)
+            start, stop = index.span(low, high)
+            spans.append((stop - start, field, start, stop))
+        _, driver, start, stop = min(spans)
+
+        checks = [(roster.columns[field], low, high)
+                  for field, low, high in ranges if field != driver]
+        matches = []
+        row_of = roster.index
+        for _, name in self.indexes[driver].entries[start:stop]:
+            row = row_of[name]
+            for column, low, high in checks:
+                value = column[row]
+                if (low is not None and value < low) or (high is not None and value > high):
+                    break
+            else:
+                matches.append(name)
+        return matches
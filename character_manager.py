@@ -1,71 +1,121 @@
 import random
 import json
+from array import array
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 from models import Character
+from character_roster import (COLUMN_TYPECODE, STAT_FIELDS, CharacterRoster,
+                              CharacterView, RosterMapping)
+from character_index import Bound, RosterIndexes
 
 
 class CharacterManager:
     """Manages character creation, editing, and persistence"""
 
-    def __init__(self):
-        self.characters: Dict[str, Character] = {}
+    def __init__(self, storage=None):
+        # Optional CharacterStorage kept up to date with every change
+        self.storage = storage
+        # name -> True (write) / False (delete), waiting for the storage
+        self._pending: Dict[str, bool] = {}
+        self._batch_depth = 0
+        # Secondary indexes on level and base stats, for query()
+        self.indexes = RosterIndexes()
+        self._use_roster(CharacterRoster())
 
-    def create_character(self, name: str, **kwargs) -> Character:
+    def _use_roster(self, roster: CharacterRoster):
+        """Switch to a roster and start listening to its changes"""
+        roster.listener = self
+        self.roster = roster
+        self.indexes.invalidate()
+
+    @property
+    def characters(self) -> RosterMapping:
+        """Dict-style view of the roster: name -> Character-compatible view"""
+        return RosterMapping(self.roster)
+
+    def create_character(self, name: str, **kwargs) -> CharacterView:
         """Create a new character with given stats"""
         char = Character(name=name, **kwargs)
-        self.characters[name] = char
-        return char
+        self.roster.add(char)
+        return self.roster.get(name)
 
     def create_random_character(self, name: str, stat_range: Tuple[int, int] = (8, 15),
-                                level_range: Tuple[int, int] = (1, 5)) -> Character:
+                                level_range: Tuple[int, int] = (1, 5),
+                                rng: Optional[random.Random] = None) -> CharacterView:
         """Create a character with randomized stats within given ranges"""
+        if rng is None:
+            rng = random
         stats = {
-            'strength': random.randint(*stat_range),
-            'dexterity': random.randint(*stat_range),
-            'intelligence': random.randint(*stat_range),
-            'wisdom': random.randint(*stat_range),
-            'agility': random.randint(*stat_range),
-            'constitution': random.randint(*stat_range),
-            'level': random.randint(*level_range)
+            'strength': rng.randint(*stat_range),
+            'dexterity': rng.randint(*stat_range),
+            'intelligence': rng.randint(*stat_range),
+            'wisdom': rng.randint(*stat_range),
+            'agility': rng.randint(*stat_range),
+            'constitution': rng.randint(*stat_range),
+            'level': rng.randint(*level_range)
         }
         return self.create_character(name, **stats)
 
+    def create_random_characters(self, base_name: str, count: int,
+                                 stat_range: Tuple[int, int] = (8, 15),
+                                 level_range: Tuple[int, int] = (1, 5),
+                                 rng=None) -> List[str]:
+        """
+        Create base_name_1 .. base_name_count with randomized stats in one pass
+        All stats are drawn in one batch per column, from rng (a NumPy
+        Generator or random.Random). Without an rng NumPy is used when it is
+        installed. Existing characters with the same names are replaced.
+        """
+        names = [f"{base_name}_{i}" for i in range(1, count + 1)]
+        columns = _random_stat_columns(count, stat_range, level_range, rng)
+        with self.batch():
+            for name in self.roster.index.keys() & names:
+                self.roster.remove(name)
+            self.roster.extend(names, [""] * count, columns)
+        return names
+
     def edit_character(self, name: str, **kwargs) -> bool:
         """Edit existing character stats"""
-        if name not in self.characters:
+        char = self.roster.get(name)
+        if char is None:
             return False
 
-        char = self.characters[name]
-        for attr, value in kwargs.items():
-            if hasattr(char, attr):
-                setattr(char, attr, value)
+        with self.batch():
+            for attr, value in kwargs.items():
+                if hasattr(char, attr):
+                    setattr(char, attr, value)
 
-        # Recalculate HP/Mana if constitution/intelligence changed
-        if 'constitution' in kwargs and char.current_hp > char.max_hp:
-            char.current_hp = char.max_hp
-        if 'intelligence' in kwargs and char.current_mana > char.max_mana:
-            char.current_mana = char.max_mana
+            # Recalculate HP/Mana if constitution/intelligence changed
+            if 'constitution' in kwargs and char.current_hp > char.max_hp:
+                char.current_hp = char.max_hp
+            if 'intelligence' in kwargs and char.current_mana > char.max_mana:
+                char.current_mana = char.max_mana
 
         return True
 
     def delete_character(self, name: str) -> bool:
         """Delete a character"""
-        if name in self.characters:
-            del self.characters[name]
-            return True
-        return False
+        return self.roster.remove(name)
 
-    def get_character(self, name: str) -> Optional[Character]:
+    def get_character(self, name: str) -> Optional[CharacterView]:
         """Get character by name"""
-        return self.characters.get(name)
+        return self.roster.get(name)
 
     def list_characters(self) -> List[str]:
         """Get list of all character names"""
-        return list(self.characters.keys())
+        return list(self.roster.names)
+
+    def query(self, **bounds: Bound) -> List[str]:
+        """
+        Find characters by level and base stat ranges
+        Each bound is an exact value or an inclusive (low, high) pair where
+        None leaves that end open, e.g. query(level=(3, 5), constitution=(14, None)).
+        """
+        return self.indexes.query(self.roster, **bounds)
 
     def save_to_file(self, filename: str):
         """Save all characters to JSON file"""
-        data = {name: char.to_dict() for name, char in self.characters.items()}
+        data = {name: self.roster.get(name).to_dict() for name in self.roster}
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
 
@@ -74,10 +124,129 @@ class CharacterManager:
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
-            self.characters = {name: Character.from_dict(char_data)
-                               for name, char_data in data.items()}
+            roster = CharacterRoster()
+            for char_data in data.values():
+                roster.add(Character.from_dict(char_data))
+            self._use_roster(roster)
+            if self.storage is not None:
+                self.storage.replace_all(roster.record(name) for name in roster)
         except FileNotFoundError:
             print(
                 f"File {filename} not found. Starting with empty character list.")
         except json.JSONDecodeError:
             print(f"Error reading {filename}. File may be corrupted.")
+
+    def save_binary(self, filename: str):
+        """Save all characters in the memory-mappable binary format"""
+        from binary_roster import export_binary
+        export_binary(self.roster, filename)
+
+    def load_binary(self, filename: str):
+        """Load characters from a binary roster file"""
+        from binary_roster import BinaryRoster
+        roster = CharacterRoster()
+        with BinaryRoster(filename) as records:
+            for name, title, values in records:
+                roster.add_values(name, title, values)
+        self._use_roster(roster)
+        if self.storage is not None:
+            self.storage.replace_all(roster.record(name) for name in roster)
+
+    def load_from_storage(self):
+        """Replace the roster with the contents of the attached storage"""
+        roster = CharacterRoster()
+        for name, title, values in self.storage.load():
+            roster.add_values(name, title, values)
+        self._pending.clear()
+        self._use_roster(roster)
+
+    @contextmanager
+    def batch(self):
+        """Group all changes made inside the block into one storage write"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_pending()
+
+    def _mark(self, name: str, present: bool):
+        """Queue a character for writing (or deletion) in the storage"""
+        if self.storage is None:
+            return
+        self._pending[name] = present
+        if self._batch_depth == 0:
+            self._flush_pending()
+
+    def _flush_pending(self):
+        """Send queued changes to the storage"""
+        if not self._pending:
+            return
+        upserts = [self.roster.record(name) for name, present in self._pending.items()
+                   if present and name in self.roster]
+        deletes = [name for name, present in self._pending.items() if not present]
+        self._pending.clear()
+        self.storage.write(upserts, deletes)
+
+    # Roster listener callbacks
+
+    def character_added(self, name: str):
+        self.indexes.character_added(self.roster, name)
+        self._mark(name, True)
+
+    def characters_added(self, names: List[str]):
+        self.indexes.characters_added(self.roster, names)
+        if self.storage is not None:
+            with self.batch():
+                for name in names:
+                    self._mark(name, True)
+
+    def character_replaced(self, name: str, old_values: Dict[str, int]):
+        row = self.roster.index[name]
+        for field, old_value in old_values.items():
+            new_value = self.roster.columns[field][row]
+            if new_value != old_value:
+                self.indexes.value_changed(name, field, old_value, new_value)
+        self._mark(name, True)
+
+    def character_removed(self, name: str):
+        self.indexes.character_removed(self.roster, name)
+        self._mark(name, False)
+
+    def character_renamed(self, old_name: str, new_name: str):
+        self.indexes.character_renamed(self.roster, old_name, new_name)
+        with self.batch():
+            self._mark(old_name, False)
+            self._mark(new_name, True)
+
+    def value_changed(self, name: str, field: str, old_value, new_value):
+        self.indexes.value_changed(name, field, old_value, new_value)
+        self._mark(name, True)
+
+
+def _random_stat_columns(count: int, stat_range: Tuple[int, int],
+                         level_range: Tuple[int, int], rng) -> Dict[str, array]:
+    """Draw level and base stats for count characters, one batch per column"""
+    if rng is None:
+        try:
+            import numpy as np
+            rng = np.random.default_rng()
+        except ImportError:
+            rng = random
+
+    columns = {}
+    for field in ('level',) + STAT_FIELDS:
+        low, high = level_range if field == 'level' else stat_range
+        if hasattr(rng, 'integers'):
+            draws = rng.integers(low, high, size=count, endpoint=True, dtype='int16')
+            column = array(COLUMN_TYPECODE)
+            column.frombytes(draws.tobytes())
+        else:
+            column = array(COLUMN_TYPECODE, rng.choices(range(low, high + 1), k=count))
+        columns[field] = column
+
+    # Everyone starts at full HP and mana
+    columns['current_hp'] = array(COLUMN_TYPECODE, [con * 2 for con in columns['constitution']])
+    columns['current_mana'] = array(COLUMN_TYPECODE, columns['intelligence'])
+    return columns
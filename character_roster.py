@@ -0,0 +1,326 @@
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from models import Character
+
+
+STAT_FIELDS = ('strength', 'dexterity', 'intelligence',
+               'wisdom', 'agility', 'constitution')
+
+# Integer columns stored per character, in record order
+COLUMNS = ('level',) + STAT_FIELDS + ('current_hp', 'current_mana')
+
+# Signed 16-bit storage for every integer column
+COLUMN_TYPECODE = 'h'
+
+
+class CharacterRoster:
+    """
+    Columnar (struct-of-arrays) character storage
+
+    Integer stats live in one typed array per column and names map to row
+    numbers. Deleting swaps the last row into the freed slot, so rows stay
+    dense and columns can be handed to vectorized consumers as they are.
+
+    An optional listener is told about every change through
+    character_added(name), characters_added(names) (bulk appends),
+    character_replaced(name, old_values) (an existing name stored again,
+    with its previous column values), character_removed(name),
+    character_renamed(old_name, new_name) and
+    value_changed(name, field, old_value, new_value).
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.titles: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.columns: Dict[str, array] = {
+            field: array(COLUMN_TYPECODE) for field in COLUMNS}
+        self.listener = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def add(self, char) -> int:
+        """Store a character (replacing one with the same name), return its row"""
+        values = [getattr(char, field) for field in COLUMNS]
+        return self.add_values(char.name, char.title, values)
+
+    def add_values(self, name: str, title: str, values: List[int]) -> int:
+        """Store a character from raw column values in COLUMNS order"""
+        # Convert up front so an out-of-range value cannot leave the
+        # columns with different lengths
+        values = array(COLUMN_TYPECODE, values)
+
+        row = self.index.get(name)
+        if row is not None:
+            # Replacing an existing character is a single update
+            old_values = {field: self.columns[field][row] for field in COLUMNS}
+            self.titles[row] = title
+            for field, value in zip(COLUMNS, values):
+                self.columns[field][row] = value
+            if self.listener is not None:
+                self.listener.character_replaced(name, old_values)
+            return row
+
+        row = len(self.names)
+        for field, value in zip(COLUMNS, values):
+            self.columns[field].append(value)
+        self.names.append(name)
+        self.titles.append(title)
+        self.index[name] = row
+
+        if self.listener is not None:
+            self.listener.character_added(name)
+        return row
+
+    def extend(self, names: List[str], titles: List[str], columns: Dict[str, Sequence[int]]):
+        """
+        Append many new characters at once from per-column value sequences
+        Names must not be in the roster yet. Columns already in the storage
+        typecode are appended without per-value conversion.
+        """
+        start = len(self.names)
+        new_index = dict(zip(names, range(start, start + len(names))))
+        if len(new_index) != len(names) or not self.index.keys().isdisjoint(new_index):
+            raise ValueError("extend() only appends characters with new, distinct names")
+        if len(titles) != len(names):
+            raise ValueError("extend() needs one title per name")
+
+        # Convert every column before touching the roster, as in add_values
+        new_columns = {}
+        for field in COLUMNS:
+            column = columns[field]
+            if not (isinstance(column, array) and column.typecode == COLUMN_TYPECODE):
+                column = array(COLUMN_TYPECODE, column)
+            if len(column) != len(names):
+                raise ValueError(f"extend() needs one {field} value per name")
+            new_columns[field] = column
+
+        for field, column in new_columns.items():
+            self.columns[field].extend(column)
+        self.names.extend(names)
+        self.titles.extend(titles)
+        self.index.update(new_index)
+
+        if self.listener is not None:
+            self.listener.characters_added(names)
+
+    def remove(self, name: str) -> bool:
+        """Remove a character, moving the last row into its slot"""
+        if name not in self.index:
+            return False
+        if self.listener is not None:
+            self.listener.character_removed(name)
+
+        row = self.index.pop(name)
+        last = len(self.names) - 1
+        if row != last:
+            moved = self.names[last]
+            self.names[row] = moved
+            self.titles[row] = self.titles[last]
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.index[moved] = row
+
+        self.names.pop()
+        self.titles.pop()
+        for column in self.columns.values():
+            column.pop()
+        return True
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        """Change a character's name in place"""
+        if old_name not in self.index or new_name in self.index:
+            return False
+        row = self.index.pop(old_name)
+        self.names[row] = new_name
+        self.index[new_name] = row
+        if self.listener is not None:
+            self.listener.character_renamed(old_name, new_name)
+        return True
+
+    def row(self, name: str) -> Optional[int]:
+        """Get the row number of a character, for use with column views"""
+        return self.index.get(name)
+
+    def get(self, name: str) -> Optional['CharacterView']:
+        """Get a live Character-compatible view of a stored character"""
+        if name not in self.index:
+            return None
+        return CharacterView(self, name)
+
+    def get_value(self, name: str, field: str):
+        """Read a single field of a character"""
+        row = self.index[name]
+        if field == 'title':
+            return self.titles[row]
+        return self.columns[field][row]
+
+    def set_value(self, name: str, field: str, value):
+        """Write a single field of a character"""
+        row = self.index[name]
+        if field == 'title':
+            old_value = self.titles[row]
+            self.titles[row] = value
+        else:
+            column = self.columns[field]
+            old_value = column[row]
+            column[row] = value
+        if self.listener is not None:
+            self.listener.value_changed(name, field, old_value, value)
+
+    def record(self, name: str) -> Tuple[str, str, Tuple[int, ...]]:
+        """Get a stored character as a (name, title, column values) record"""
+        row = self.index[name]
+        return name, self.titles[row], tuple(self.columns[field][row] for field in COLUMNS)
+
+    def to_character(self, name: str) -> Optional[Character]:
+        """Get a detached Character copy of a stored character"""
+        row = self.index.get(name)
+        if row is None:
+            return None
+        values = {field: self.columns[field][row] for field in COLUMNS}
+        return Character(name=name, title=self.titles[row], **values)
+
+    def column(self, field: str) -> memoryview:
+        """
+        Zero-copy view of one column, indexed by row
+        The roster cannot grow or shrink while a view is held, so release it
+        (or use it as a context manager) before adding or removing characters.
+        """
+        return memoryview(self.columns[field])
+
+    def as_numpy(self, field: str, copy: bool = False):
+        """
+        Zero-copy NumPy view of one column (requires NumPy)
+        As with column(), the roster cannot grow or shrink while the array is
+        alive; pass copy=True for an array that can be kept across changes.
+        """
+        import numpy as np
+        view = np.frombuffer(self.columns[field], dtype=np.int16)
+        return view.copy() if copy else view
+
+
+def _column_property(field: str) -> property:
+    """Property reading and writing one roster column for a CharacterView"""
+
+    def fget(self):
+        roster = self._roster
+        return roster.columns[field][roster.index[self._name]]
+
+    def fset(self, value):
+        self._roster.set_value(self._name, field, value)
+
+    return property(fget, fset)
+
+
+class CharacterView:
+    """
+    Character-compatible proxy for one roster row
+
+    Reads and writes go straight to the roster columns, and the derived
+    properties and combat helpers are shared with Character.
+    """
+
+    __slots__ = ('_roster', '_name')
+
+    def __init__(self, roster: CharacterRoster, name: str):
+        self._roster = roster
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        if value != self._name:
+            if not self._roster.rename(self._name, value):
+                raise ValueError(f"Cannot rename {self._name} to {value}")
+            self._name = value
+
+    @property
+    def title(self) -> str:
+        return self._roster.get_value(self._name, 'title')
+
+    @title.setter
+    def title(self, value: str):
+        self._roster.set_value(self._name, 'title', value)
+
+    level = _column_property('level')
+    strength = _column_property('strength')
+    dexterity = _column_property('dexterity')
+    intelligence = _column_property('intelligence')
+    wisdom = _column_property('wisdom')
+    agility = _column_property('agility')
+    constitution = _column_property('constitution')
+    current_hp = _column_property('current_hp')
+    current_mana = _column_property('current_mana')
+
+    max_hp = Character.max_hp
+    max_mana = Character.max_mana
+    mana_regen = Character.mana_regen
+    is_alive = Character.is_alive
+    heal = Character.heal
+    take_damage = Character.take_damage
+    regenerate_mana = Character.regenerate_mana
+    spend_mana = Character.spend_mana
+    reset_to_full = Character.reset_to_full
+    get_display_name = Character.get_display_name
+    __str__ = Character.__str__
+
+    def to_dict(self) -> Dict:
+        """Convert character to dictionary for saving"""
+        data = {'name': self._name, 'level': self.level, 'title': self.title}
+        for field in STAT_FIELDS + ('current_hp', 'current_mana'):
+            data[field] = getattr(self, field)
+        return data
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CharacterView):
+            return self._roster is other._roster and self._name == other._name
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._roster), self._name))
+
+    def __repr__(self) -> str:
+        return f"CharacterView({self._name!r})"
+
+
+class RosterMapping(MutableMapping):
+    """Dict-style access to a roster: name -> CharacterView"""
+
+    def __init__(self, roster: CharacterRoster):
+        self._roster = roster
+
+    def __getitem__(self, name: str) -> CharacterView:
+        view = self._roster.get(name)
+        if view is None:
+            raise KeyError(name)
+        return view
+
+    def __setitem__(self, name: str, char):
+        if char.name != name:
+            char = Character.from_dict(dict(char.to_dict(), name=name))
+        self._roster.add(char)
+
+    def __delitem__(self, name: str):
+        if not self._roster.remove(name):
+            raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._roster.names))
+
+    def __len__(self) -> int:
+        return len(self._roster)
+
+    def __contains__(self, name) -> bool:
+        return name in self._roster
@@ -0,0 +1,320 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Tuple
+from character_roster import COLUMNS, STAT_FIELDS
+
+
+# One stored character: (name, title, values in COLUMNS order)
+Record = Tuple[str, str, Tuple[int, ...]]
+
+
+class CharacterStorage(ABC):
+    """
+    Persistent storage backend for a CharacterManager
+
+    The manager reports changes as they happen: write() receives the
+    characters that were created or changed (as records) and the names that
+    were deleted, grouped into one call per operation or batch.
+    """
+
+    @abstractmethod
+    def load(self) -> Iterable[Record]:
+        """Yield every stored character"""
+
+    @abstractmethod
+    def write(self, upserts: List[Record], deletes: List[str]):
+        """Store changed characters and remove deleted ones"""
+
+    @abstractmethod
+    def replace_all(self, records: Iterable[Record]):
+        """Replace the whole stored roster"""
+
+    def flush(self):
+        """Make sure everything written so far is durable"""
+
+    def close(self):
+        """Release any open files or connections"""
+
+
+class SQLiteStorage(CharacterStorage):
+    """
+    SQLite-backed storage with one row per character
+    Name is the primary key and level and each base stat are indexed, so
+    single-character changes are single-row writes and stat queries can be
+    answered by the database.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        columns = ", ".join(f"{column} INTEGER NOT NULL" for column in COLUMNS)
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS characters ("
+                f"name TEXT PRIMARY KEY, title TEXT NOT NULL, {columns})")
+            for column in ('level',) + STAT_FIELDS:
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_characters_{column} "
+                    f"ON characters ({column})")
+
+        placeholders = ", ".join("?" * (len(COLUMNS) + 2))
+        self._upsert_sql = (f"INSERT OR REPLACE INTO characters "
+                            f"(name, title, {', '.join(COLUMNS)}) VALUES ({placeholders})")
+        self._select_sql = f"SELECT name, title, {', '.join(COLUMNS)} FROM characters"
+
+    def load(self) -> Iterable[Record]:
+        """Yield every stored character"""
+        for row in self.connection.execute(self._select_sql):
+            yield row[0], row[1], row[2:]
+
+    def write(self, upserts: List[Record], deletes: List[str]):
+        """Store changed characters and remove deleted ones in one transaction"""
+        with self.connection:
+            if deletes:
+                self.connection.executemany(
+                    "DELETE FROM characters WHERE name = ?",
+                    [(name,) for name in deletes])
+            if upserts:
+                self.connection.executemany(
+                    self._upsert_sql,
+                    [(name, title) + tuple(values) for name, title, values in upserts])
+
+    def replace_all(self, records: Iterable[Record]):
+        """Replace the whole stored roster in one transaction"""
+        with self.connection:
+            self.connection.execute("DELETE FROM characters")
+            self.connection.executemany(
+                self._upsert_sql,
+                ((name, title) + tuple(values) for name, title, values in records))
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+class JournalStorage(CharacterStorage):
+    """
+    Snapshot file plus an append-only change journal
+
+    The snapshot uses the same JSON layout as CharacterManager.save_to_file.
+    Every change is appended to the journal as one compact JSON line and the
+    journal is fsynced every sync_every records (and on flush). Once the
+    journal holds compact_after records it is rotated and folded into a new
+    snapshot on a background thread. Loading reads the snapshot and replays
+    the journal tail.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: Optional[str] = None,
+                 sync_every: int = 64, compact_after: int = 10000):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or snapshot_path + ".journal"
+        # Journal being folded into the snapshot by a compaction
+        self.compacting_path = self.journal_path + ".compacting"
+        self.sync_every = sync_every
+        self.compact_after = compact_after
+
+        self._lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+        # A crash mid-write leaves a partial last line; appending after it
+        # would glue the next record onto it
+        _truncate_torn_tail(self.journal_path)
+        self._journal = open(self.journal_path, 'a')
+        self._journal_records = _count_lines(self.journal_path)
+        self._unsynced = 0
+
+    def load(self) -> Iterable[Record]:
+        """Yield every character from the snapshot with the journal replayed"""
+        self.wait_for_compaction()
+        self._journal.flush()
+        return read_journaled_roster(self.snapshot_path, self.journal_path)
+
+    def write(self, upserts: List[Record], deletes: List[str]):
+        """Append changes to the journal"""
+        lines = [json.dumps(["d", name], separators=(',', ':')) for name in deletes]
+        lines.extend(json.dumps(["u", name, title, list(values)], separators=(',', ':'))
+                     for name, title, values in upserts)
+        if not lines:
+            return
+
+        with self._lock:
+            self._journal.write("\n".join(lines) + "\n")
+            self._journal_records += len(lines)
+            self._unsynced += len(lines)
+            if self._unsynced >= self.sync_every:
+                self._sync()
+        if self._journal_records >= self.compact_after:
+            self.compact()
+
+    def replace_all(self, records: Iterable[Record]):
+        """Write a fresh snapshot and discard the journal"""
+        self.wait_for_compaction()
+        data = {name: _record_to_dict(name, title, values)
+                for name, title, values in records}
+        with self._lock:
+            _write_snapshot(self.snapshot_path, data)
+            if os.path.exists(self.compacting_path):
+                # Left by an interrupted compaction; load() would replay it
+                os.remove(self.compacting_path)
+            self._journal.close()
+            self._journal = open(self.journal_path, 'w')
+            self._journal_records = 0
+            self._unsynced = 0
+
+    def compact(self, wait: bool = False):
+        """
+        Fold the journal into the snapshot on a background thread
+        Writes keep going to a fresh journal in the meantime.
+        """
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            if os.path.exists(self.compacting_path):
+                # An earlier compaction was interrupted; finish it first
+                _fold_journal(self.snapshot_path, self.compacting_path)
+            self._sync()
+            self._journal.close()
+            os.replace(self.journal_path, self.compacting_path)
+            self._journal = open(self.journal_path, 'a')
+            self._journal_records = 0
+
+            self._compaction = threading.Thread(
+                target=_fold_journal, args=(self.snapshot_path, self.compacting_path),
+                daemon=True)
+            self._compaction.start()
+        if wait:
+            self.wait_for_compaction()
+
+    def wait_for_compaction(self):
+        """Block until a running compaction has finished"""
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+
+    def flush(self):
+        """Flush and fsync the journal"""
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        """
+        Flush the journal and wait for any running compaction
+        The journal is then folded into the snapshot, so readers that only
+        know the snapshot file see every change.
+        """
+        self.flush()
+        self.wait_for_compaction()
+        self._journal.close()
+        if os.path.exists(self.compacting_path):
+            _fold_journal(self.snapshot_path, self.compacting_path)
+        if self._journal_records or not os.path.exists(self.snapshot_path):
+            _fold_journal(self.snapshot_path, self.journal_path)
+        else:
+            os.remove(self.journal_path)
+
+    def _sync(self):
+        """fsync the journal (caller holds the lock)"""
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._unsynced = 0
+
+
+def read_journaled_roster(snapshot_path: str,
+                          journal_path: Optional[str] = None) -> Iterable[Record]:
+    """
+    Yield every character of a JournalStorage without opening it
+    Reads the snapshot and replays the journals, but never truncates or
+    writes them, so it is safe while another process is appending.
+    """
+    journal_path = journal_path or snapshot_path + ".journal"
+    data = _read_snapshot(snapshot_path)
+    for path in (journal_path + ".compacting", journal_path):
+        _replay_journal(path, data)
+    for name, char_data in data.items():
+        yield (name, char_data.get('title', ''),
+               tuple(char_data[column] for column in COLUMNS))
+
+
+def _record_to_dict(name: str, title: str, values) -> Dict:
+    """Convert a record to the Character.to_dict layout"""
+    data = {'name': name, 'title': title}
+    data.update(zip(COLUMNS, values))
+    return data
+
+
+def _count_lines(path: str) -> int:
+    """Count the lines of a file, 0 if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return sum(1 for _ in f)
+    except FileNotFoundError:
+        return 0
+
+
+def _truncate_torn_tail(path: str):
+    """Cut a journal back to its last complete line"""
+    try:
+        with open(path, 'r+b') as f:
+            end = position = f.seek(0, os.SEEK_END)
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                newline = f.read(step).rfind(b'\n')
+                if newline != -1:
+                    position += newline + 1 - step
+                    break
+                position -= step
+            if position != end:
+                f.truncate(position)
+    except FileNotFoundError:
+        pass
+
+
+def _read_snapshot(path: str) -> Dict[str, Dict]:
+    """Read a snapshot, empty if it does not exist yet"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_snapshot(path: str, data: Dict[str, Dict]):
+    """Atomically replace a snapshot"""
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _replay_journal(path: str, data: Dict[str, Dict]):
+    """Apply journal records to snapshot data in place"""
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write, later records are still valid
+                if record[0] == "d":
+                    data.pop(record[1], None)
+                else:
+                    _, name, title, values = record
+                    data[name] = _record_to_dict(name, title, values)
+    except FileNotFoundError:
+        pass
+
+
+def _fold_journal(snapshot_path: str, journal_path: str):
+    """Write snapshot + journal as the new snapshot, then drop the journal"""
+    data = _read_snapshot(snapshot_path)
+    _replay_journal(journal_path, data)
+    _write_snapshot(snapshot_path, data)
+    os.remove(journal_path)
@@ -1,79 +1,430 @@
 import random
-from typing import Dict, List
-from models import Character
+from bisect import bisect_right
+from enum import IntEnum
+from fractions import Fraction
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from models import Combatant, CombatResult
+
+
+# Bump whenever combat rules change, so cached simulation results go stale
+ENGINE_VERSION = 1
+
+# Hit chance: base 50% + (attacker_dex - defender_dex) * 3%, clamped to 5%-95%
+BASE_HIT_CHANCE = 0.5
+HIT_CHANCE_PER_DEX = 0.03
+MIN_HIT_CHANCE = 0.05
+MAX_HIT_CHANCE = 0.95
+
+# Damage: 80% to 120% of STR, truncated, at least 1
+DAMAGE_VARIANCE = (Fraction(8, 10), Fraction(12, 10))
+
+# Stat values covered by the tables built at import time
+TABLE_MAX_STAT = 30
+
+
+def _compute_hit_chance(dex_difference: int) -> float:
+    """Hit chance for a given attacker-minus-defender DEX difference"""
+    hit_chance = BASE_HIT_CHANCE + (dex_difference * HIT_CHANCE_PER_DEX)
+    return max(MIN_HIT_CHANCE, min(MAX_HIT_CHANCE, hit_chance))
+
+
+def damage_distribution(strength: int) -> List[Tuple[int, float]]:
+    """
+    Exact distribution of max(1, int(STR * U(0.8, 1.2)))
+    Returns (damage, probability) pairs in increasing damage order
+    """
+    if strength <= 0:
+        return [(1, 1.0)]
+
+    low, high = DAMAGE_VARIANCE
+    probabilities: Dict[int, Fraction] = {}
+    for damage in range(int(strength * low), int(strength * high) + 1):
+        # int(STR * u) == damage  <=>  damage / STR <= u < (damage + 1) / STR
+        start = max(low, Fraction(damage, strength))
+        end = min(high, Fraction(damage + 1, strength))
+        if end > start:
+            key = max(1, damage)
+            probabilities[key] = probabilities.get(key, 0) + (end - start) / (high - low)
+    return [(damage, float(p)) for damage, p in sorted(probabilities.items())]
+
+
+def _build_damage_table(strength: int) -> Tuple[List[float], List[int]]:
+    """Cumulative probabilities and damage values for one STR value"""
+    cumulative, values = [], []
+    total = 0.0
+    for damage, probability in damage_distribution(strength):
+        total += probability
+        cumulative.append(total)
+        values.append(damage)
+    # Guard against rounding so every uniform draw in [0, 1) maps to a value
+    cumulative[-1] = 1.0
+    return cumulative, values
+
+
+# Hit chance indexed by DEX difference + HIT_TABLE_OFFSET; differences
+# beyond the table are clamped anyway
+HIT_TABLE_OFFSET = round((MAX_HIT_CHANCE - BASE_HIT_CHANCE) / HIT_CHANCE_PER_DEX) + 1
+HIT_CHANCE_TABLE = [_compute_hit_chance(diff)
+                    for diff in range(-HIT_TABLE_OFFSET, HIT_TABLE_OFFSET + 1)]
+
+# (cumulative probabilities, damage values) by STR
+DAMAGE_TABLES: Dict[int, Tuple[List[float], List[int]]] = {
+    strength: _build_damage_table(strength) for strength in range(TABLE_MAX_STAT + 1)}
+
+
+def hit_chance_for(dex_difference: int) -> float:
+    """Look up the hit chance for an attacker-minus-defender DEX difference"""
+    index = dex_difference + HIT_TABLE_OFFSET
+    if index < 0:
+        index = 0
+    elif index >= len(HIT_CHANCE_TABLE):
+        index = len(HIT_CHANCE_TABLE) - 1
+    return HIT_CHANCE_TABLE[index]
+
+
+def damage_table(strength: int) -> Tuple[List[float], List[int]]:
+    """Get the damage table for a STR value, building it on first use if needed"""
+    table = DAMAGE_TABLES.get(strength)
+    if table is None:
+        table = DAMAGE_TABLES[strength] = _build_damage_table(strength)
+    return table
+
+
+def damage_from_roll(strength: int, roll: float) -> int:
+    """Map a uniform draw in [0, 1) to a damage value for the given STR"""
+    cumulative, values = damage_table(strength)
+    return values[bisect_right(cumulative, roll)]
+
+
+class EventKind(IntEnum):
+    """Kinds of combat log events"""
+    START = 0     # combat begins
+    ROUND = 1     # a new round begins
+    HIT = 2       # amount = damage dealt
+    KILL = 3      # a hit that defeats the target, amount = damage dealt
+    MISS = 4
+    REGEN = 5     # amount = mana regenerated
+    TIMEOUT = 6   # max rounds reached
+    END = 7       # combat over, see CombatLog.summary
+    NOTE = 8      # free-form message, amount = message text
+
+
+# Event records are plain tuples in this field order
+EVENT_FIELDS = ('round', 'actor_id', 'target_id', 'kind', 'amount')
+
+# Actor/target id used when an event has no participant
+NO_PARTICIPANT = -1
+
+
+def _format_starting_state(char: Combatant, hp: int, mana: int) -> str:
+    """Format a combatant as it was when combat began"""
+    return (f"{char.get_display_name()}\n"
+            f"STR:{char.strength} DEX:{char.dexterity} INT:{char.intelligence} "
+            f"WIS:{char.wisdom} AGI:{char.agility} CON:{char.constitution}\n"
+            f"HP:{hp}/{char.max_hp} MP:{mana}/{char.max_mana}")
+
+
+class CombatLog:
+    """
+    Compact combat event log
+    Events are stored as (round, actor_id, target_id, kind, amount) tuples,
+    where ids are positions in the participant list (0 is the player).
+    Text is only produced when the log is rendered.
+    """
+
+    def __init__(self):
+        self.events: List[Tuple] = []
+        self.participants: List[Combatant] = []
+        self.starting_state: List[Tuple[int, int]] = []
+        self.summary: Optional[Tuple] = None
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def begin(self, participants: List[Combatant]):
+        """Start a new combat: remember participants and their starting HP/mana"""
+        self.participants = participants
+        self.starting_state = [(p.current_hp, p.current_mana) for p in participants]
+        self.events.append((0, NO_PARTICIPANT, NO_PARTICIPANT, EventKind.START, 0))
+
+    def record(self, round_num: int, actor_id: int, target_id: int,
+               kind: EventKind, amount=0):
+        """Append one event"""
+        self.events.append((round_num, actor_id, target_id, kind, amount))
+
+    def finish(self, result: CombatResult, rounds: int, enemies_remaining: int):
+        """Record the end of combat together with its summary"""
+        player = self.participants[0]
+        self.summary = (result, rounds, player.current_hp, player.max_hp,
+                        enemies_remaining, len(self.participants) - 1)
+        self.events.append((rounds, NO_PARTICIPANT, NO_PARTICIPANT, EventKind.END, 0))
+
+    def clear(self):
+        """Remove all events"""
+        self.events.clear()
+        self.participants = []
+        self.starting_state = []
+        self.summary = None
+
+    def format_event(self, event: Tuple) -> List[str]:
+        """Render one event as log lines"""
+        round_num, actor_id, target_id, kind, amount = event
+        names = self.participants
+
+        if kind == EventKind.HIT:
+            return [f"{names[actor_id].name} hits {names[target_id].name} for {amount} damage!"]
+        if kind == EventKind.KILL:
+            target = names[target_id].name
+            return [f"{names[actor_id].name} hits {target} for {amount} damage! "
+                    f"{target} is defeated!"]
+        if kind == EventKind.MISS:
+            return [f"{names[actor_id].name} misses {names[target_id].name}!"]
+        if kind == EventKind.REGEN:
+            return [f"{names[actor_id].name} regenerates {amount} mana."]
+        if kind == EventKind.ROUND:
+            return [f"--- Round {round_num} ---"]
+        if kind == EventKind.START:
+            participants = [_format_starting_state(p, *state) for p, state
+                            in zip(self.participants, self.starting_state)]
+            lines = ["=== COMBAT START ===",
+                     f"Player: {participants[0]}",
+                     f"Enemies: {len(participants) - 1}"]
+            lines.extend(f"  {i}. {enemy}" for i, enemy in enumerate(participants[1:], 1))
+            lines.append("")
+            return lines
+        if kind == EventKind.TIMEOUT:
+            return [f"Combat ended after {round_num} rounds (timeout)"]
+        if kind == EventKind.END:
+            result, rounds, player_hp, player_max_hp, remaining, total = self.summary
+            return ["\n=== COMBAT END ===",
+                    f"Result: {result.value.upper()}",
+                    f"Rounds: {rounds}",
+                    f"Player HP: {player_hp}/{player_max_hp}",
+                    f"Enemies remaining: {remaining}/{total}"]
+        return [str(amount)]
+
+    def __iter__(self):
+        return iter(self.render())
+
+    def render(self) -> List[str]:
+        """Render the whole log as text lines"""
+        lines = []
+        for event in self.events:
+            lines.extend(self.format_event(event))
+        return lines
+
+
+class TurnScheduler:
+    """
+    Persistent turn order for one combat
+    Participants are grouped and sorted by AGI once; each round only the
+    members of equal-AGI groups are shuffled to break ties. Removing a
+    defeated participant is O(1): it is marked, and its group is compacted
+    the next time the order is built.
+    """
+
+    def __init__(self, participants: List[Combatant], rng=None):
+        self.rng = rng if rng is not None else random
+        by_agility: Dict[int, List[Combatant]] = {}
+        for participant in participants:
+            if participant.is_alive:
+                by_agility.setdefault(participant.agility, []).append(participant)
+        self.groups: List[List[Combatant]] = [
+            by_agility[agility] for agility in sorted(by_agility, reverse=True)]
+        self._group_of = {id(member): group
+                          for group in self.groups for member in group}
+        self._removed: Dict[int, List[Combatant]] = {}
+
+    def remove(self, participant: Combatant):
+        """Drop a participant from future rounds"""
+        group = self._group_of.pop(id(participant), None)
+        if group is not None:
+            self._removed.setdefault(id(group), group)
+
+    def next_round(self) -> List[Combatant]:
+        """Turn order for the next round (AGI highest first, random tiebreaker)"""
+        if self._removed:
+            for group in self._removed.values():
+                group[:] = [member for member in group if id(member) in self._group_of]
+            self._removed.clear()
+            self.groups = [group for group in self.groups if group]
+
+        rng = self.rng
+        order: List[Combatant] = []
+        for group in self.groups:
+            if len(group) > 1:
+                rng.shuffle(group)
+            order.extend(group)
+        return order
+
+
+class LivingList:
+    """
+    Living enemies kept in their original order
+    Removal is O(n) but targets are picked exactly as from a freshly
+    rebuilt list of living enemies.
+    """
+
+    def __init__(self, members: List[Combatant]):
+        self.members = [member for member in members if member.is_alive]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def discard(self, member: Combatant):
+        """Remove a defeated member"""
+        if member in self.members:
+            self.members.remove(member)
+
+    def choice(self, rng) -> Combatant:
+        """Pick a random living member"""
+        return rng.choice(self.members)
+
+
+class LivingSet(LivingList):
+    """
+    Living enemies for large battles
+    Removal swaps the last member into the freed slot, so both removal and
+    random choice are O(1) at the cost of not preserving the original order.
+    """
+
+    def __init__(self, members: List[Combatant]):
+        super().__init__(members)
+        self._slot = {id(member): i for i, member in enumerate(self.members)}
+
+    def discard(self, member: Combatant):
+        """Remove a defeated member"""
+        slot = self._slot.pop(id(member), None)
+        if slot is None:
+            return
+        last = self.members.pop()
+        if last is not member:
+            self.members[slot] = last
+            self._slot[id(last)] = slot
 
 
 class CombatEngine:
     """Handles turn-based combat simulation"""
 
-    def __init__(self):
-        self.combat_log: List[str] = []
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Random stream for hit rolls, damage and tie-breaks
+        self.rng = rng if rng is not None else random
+        self.combat_log = CombatLog()
+        # Record start/end events; per-swing events need detailed_log too
+        self.record_log = True
+        self.detailed_log = False
+        self.current_round = 0
+        # Optional Instrumentation receiving counters, timings and hook events
+        self.instrumentation = None
+
+    @property
+    def rng(self):
+        """Random stream for every kind of draw; setting it replaces all of them"""
+        return self._rng
 
-    def calculate_hit_chance(self, attacker: Character, defender: Character) -> float:
+    @rng.setter
+    def rng(self, rng):
+        self._rng = rng
+        self.hit_rng = rng
+        self.damage_rng = rng
+        self.order_rng = rng
+
+    def use_streams(self, hit_rng, damage_rng, order_rng):
+        """
+        Draw hit rolls, damage and turn-order tie-breaks from separate streams
+        Comparisons that replay the same streams with different builds then
+        line up draw for draw (common random numbers).
+        """
+        self.hit_rng = hit_rng
+        self.damage_rng = damage_rng
+        self.order_rng = order_rng
+
+    def calculate_hit_chance(self, attacker: Combatant, defender: Combatant) -> float:
         """Calculate hit chance based on attacker DEX vs defender DEX"""
-        # Base 50% + (attacker_dex - defender_dex) * 3%
-        # Clamped between 5% and 95%
-        base_chance = 0.5
-        dex_difference = attacker.dexterity - defender.dexterity
-        hit_chance = base_chance + (dex_difference * 0.03)
-        return max(0.05, min(0.95, hit_chance))
-
-    def calculate_damage(self, attacker: Character) -> int:
-        """Calculate base damage from STR with some randomization"""
-        base_damage = attacker.strength
-        # Add some variance: 80% to 120% of base damage
-        variance = random.uniform(0.8, 1.2)
-        return max(1, int(base_damage * variance))
-
-    def attack(self, attacker: Character, defender: Character) -> Dict:
+        return hit_chance_for(attacker.dexterity - defender.dexterity)
+
+    def calculate_damage(self, attacker: Combatant) -> int:
+        """Calculate damage from STR: 80% to 120% of STR via the damage table"""
+        return damage_from_roll(attacker.strength, self.damage_rng.random())
+
+    def attack(self, attacker: Combatant, defender: Combatant) -> Dict:
         """Perform an attack and return result details"""
+        inst = self.instrumentation
+        if inst is not None:
+            started = perf_counter()
+
         if not attacker.is_alive:
-            return {"hit": False, "damage": 0, "message": f"{attacker.name} is defeated and cannot attack!"}
+            return {"hit": False, "damage": 0}
 
         hit_chance = self.calculate_hit_chance(attacker, defender)
-        hit_roll = random.random()
+        hit_roll = self.hit_rng.random()
 
         if hit_roll <= hit_chance:
             damage = self.calculate_damage(attacker)
             actual_damage = defender.take_damage(damage)
 
-            message = f"{attacker.name} hits {defender.name} for {actual_damage} damage!"
-            if not defender.is_alive:
-                message += f" {defender.name} is defeated!"
+            if self.detailed_log:
+                kind = EventKind.HIT if defender.is_alive else EventKind.KILL
+                self._record(attacker.combat_id, defender.combat_id, kind, actual_damage)
 
-            return {
+            result = {
                 "hit": True,
                 "damage": actual_damage,
-                "message": message,
                 "hit_chance": hit_chance
             }
         else:
-            return {
+            if self.detailed_log:
+                self._record(attacker.combat_id, defender.combat_id, EventKind.MISS)
+            result = {
                 "hit": False,
                 "damage": 0,
-                "message": f"{attacker.name} misses {defender.name}!",
                 "hit_chance": hit_chance
             }
 
-    def determine_turn_order(self, participants: List[Character]) -> List[Character]:
+        if inst is not None:
+            inst.attack_resolved(attacker, defender, result, perf_counter() - started)
+        return result
+
+    def determine_turn_order(self, participants: List[Combatant]) -> List[Combatant]:
         """Sort participants by AGI (highest first), with random tiebreaker"""
-        return sorted(participants, key=lambda x: (x.agility, random.random()), reverse=True)
+        inst = self.instrumentation
+        if inst is not None:
+            started = perf_counter()
+        rng = self.order_rng
+        order = sorted(participants, key=lambda x: (x.agility, rng.random()), reverse=True)
+        if inst is not None:
+            inst.add_time('turn_order', perf_counter() - started)
+        return order
 
-    def process_turn(self, character: Character):
+    def process_turn(self, character: Combatant):
         """Process end-of-turn effects (mana regeneration)"""
         if character.is_alive:
             mana_regen = character.regenerate_mana()
-            if mana_regen > 0 and hasattr(self, '_detailed_log') and self._detailed_log:
-                self.log(f"{character.name} regenerates {mana_regen} mana.")
+            if self.instrumentation is not None:
+                self.instrumentation.mana_regenerated(character, mana_regen)
+            if mana_regen > 0 and self.detailed_log:
+                self._record(character.combat_id, NO_PARTICIPANT, EventKind.REGEN, mana_regen)
+
+    def _record(self, actor_id: int, target_id: int, kind: EventKind, amount=0):
+        """Record an event of the current round, timing it when instrumented"""
+        inst = self.instrumentation
+        if inst is None:
+            self.combat_log.record(self.current_round, actor_id, target_id, kind, amount)
+        else:
+            started = perf_counter()
+            self.combat_log.record(self.current_round, actor_id, target_id, kind, amount)
+            inst.add_time('logging', perf_counter() - started)
 
     def log(self, message: str):
-        """Add message to combat log"""
-        self.combat_log.append(message)
+        """Add a free-form message to the combat log"""
+        if self.record_log:
+            self._record(NO_PARTICIPANT, NO_PARTICIPANT, EventKind.NOTE, message)
 
     def clear_log(self):
-        """Clear the combat log"""
-        self.combat_log.clear()
+        """Start a fresh combat log (logs handed out earlier are kept intact)"""
+        self.combat_log = CombatLog()
 
     def get_combat_log(self) -> List[str]:
-        """Get copy of combat log"""
-        return self.combat_log.copy()
+        """Render the combat log as text lines"""
+        return self.combat_log.render()
@@ -1,50 +1,180 @@
+import math
+import os
 import random
-from typing import Dict, List
+from collections import Counter
+from statistics import NormalDist
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple, Union
+from models import Character, Combatant, CombatResult
+from combat_engine import (CombatEngine, EventKind, LivingList, LivingSet,
+                           NO_PARTICIPANT, TurnScheduler)
+from rng_streams import make_numpy_rng, make_rng, make_streams, new_root_seed
+from worker_pool import chunk_ranges, run_chunks
+
+
+# Combat backends selectable in simulate_many
+BACKENDS = ("python", "numpy")
+
+# Fights resolved per array batch by the vectorized backend
+VECTORIZED_BATCH_SIZE = 10000
 
 
 class CombatSimulation:
     """Main combat simulation controller"""
 
-    def __init__(self, character_manager):
+    def __init__(self, character_manager, rng: Optional[random.Random] = None,
+                 cache=None, instrumentation=None):
         self.char_manager = character_manager
-        from combat_engine import CombatEngine  # Fixed: import here
-        self.combat_engine = CombatEngine()
+        self.rng = rng if rng is not None else random
+        self.combat_engine = CombatEngine(self.rng)
+        # Optional Instrumentation shared with the engine
+        self.combat_engine.instrumentation = instrumentation
+        # Optional SimulationCache consulted by simulate_many
+        self.cache = cache
+
+    @property
+    def instrumentation(self):
+        """Instrumentation attached to the combat engine, None when disabled"""
+        return self.combat_engine.instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation):
+        self.combat_engine.instrumentation = instrumentation
 
     def simulate_combat(self, player_name: str, enemies: List[Character],
-                        max_rounds: int = 100, detailed_log: bool = True) -> Dict:
+                        max_rounds: int = 100, detailed_log: bool = True,
+                        record_log: bool = True,
+                        rng: Optional[random.Random] = None,
+                        large_battle: bool = False,
+                        streams: Optional[Dict[str, random.Random]] = None) -> Dict:
         """
         Simulate combat between player and enemies
-        Returns combat result and statistics
+        detailed_log adds per-swing events to the log; record_log=False keeps
+        no log at all, which is what batch runs want.
+        rng overrides the simulation's random stream for this combat only;
+        streams (see rng_streams.make_streams) splits it into one stream per
+        kind of draw, as paired comparisons do.
+        large_battle tracks living enemies in a swap-remove LivingSet, so
+        horde fights run in linear time; targets are then picked in a
+        different order than the default LivingList for the same seed.
+        Returns combat result and statistics; "combat_log" is the CombatLog,
+        rendered to text lines only when iterated
         """
-        player = self.char_manager.get_character(player_name)
-        if not player:
+        stored_player = self.char_manager.get_character(player_name)
+        if not stored_player:
             return {"error": f"Player character '{player_name}' not found"}
 
-        # Reset all participants to full health/mana
-        player.reset_to_full()
-        for enemy in enemies:
-            enemy.reset_to_full()
+        # Fight on fresh runtime copies at full health/mana
+        player = Combatant(stored_player)
+        enemies = [Combatant(enemy) for enemy in enemies]
+        return self.run_combat(player, enemies, max_rounds, detailed_log,
+                               record_log, rng, large_battle, streams)
+
+    def run_combat(self, player: Combatant, enemies: List[Combatant],
+                   max_rounds: int = 100, detailed_log: bool = True,
+                   record_log: bool = True,
+                   rng: Optional[random.Random] = None,
+                   large_battle: bool = False,
+                   streams: Optional[Dict[str, random.Random]] = None) -> Dict:
+        """
+        Fight with runtime combatants in their current state
+        HP and mana are not reset, so callers can carry damage between fights.
+        Takes the same options and returns the same result as simulate_combat
+        """
+        fight = self._combat_turns(player, enemies, max_rounds, detailed_log,
+                                   record_log, rng, large_battle, stream=False,
+                                   streams=streams)
+        result = _run_to_end(fight)
+        result["combat_log"] = self.combat_engine.combat_log
+        return result
+
+    def simulate_combat_iter(self, player_name: str, enemies: List[Character],
+                             max_rounds: int = 100, detailed_log: bool = True,
+                             rng: Optional[random.Random] = None,
+                             large_battle: bool = False, as_text: bool = False):
+        """
+        Simulate combat, yielding log events as they happen
+        Events are (round, actor_id, target_id, kind, amount) tuples, where
+        actor 0 is the player and actor i is enemies[i - 1]; with as_text they
+        are rendered to log lines instead. Nothing is kept once yielded.
+        Each iterator fights on its own engine (sharing only the
+        instrumentation), so other simulations can run while it is open.
+        The final item is the summary dict of simulate_combat, without the log.
+        """
+        stored_player = self.char_manager.get_character(player_name)
+        if not stored_player:
+            yield {"error": f"Player character '{player_name}' not found"}
+            return
+
+        player = Combatant(stored_player)
+        enemies = [Combatant(enemy) for enemy in enemies]
+        engine = CombatEngine(self.rng)
+        engine.instrumentation = self.instrumentation
+        fight = self._combat_turns(player, enemies, max_rounds, detailed_log,
+                                   True, rng, large_battle, stream=True, engine=engine)
+        # The first step sets the fight up and hands out its fresh log
+        combat_log = next(fight)
+
+        while True:
+            try:
+                next(fight)
+            except StopIteration as stop:
+                summary = stop.value
+                break
+            yield from _drain_events(combat_log, as_text)
+
+        yield from _drain_events(combat_log, as_text)
+        yield summary
 
-        self.combat_engine.clear_log()
-        self.combat_engine._detailed_log = detailed_log
+    def _combat_turns(self, player: Combatant, enemies: List[Combatant],
+                      max_rounds: int, detailed_log: bool, record_log: bool,
+                      rng: Optional[random.Random], large_battle: bool,
+                      stream: bool,
+                      streams: Optional[Dict[str, random.Random]] = None,
+                      engine: Optional[CombatEngine] = None):
+        """
+        Combat loop shared by the simulate_combat variants
+        Fights on engine, the simulation's own engine by default.
+        When stream is set, the generator first yields this fight's CombatLog
+        and then yields after every turn. It returns the result dict (without
+        the log) when the fight is over.
+        """
+        if rng is None:
+            rng = self.rng
+        if engine is None:
+            engine = self.combat_engine
+        engine.rng = rng
+        target_rng = rng
+        if streams is not None:
+            engine.use_streams(streams['hit'], streams['damage'], streams['order'])
+            target_rng = streams['target']
+        engine.clear_log()
+        engine.record_log = record_log
+        engine.detailed_log = detailed_log and record_log
+        engine.current_round = 0
+        combat_log = engine.combat_log
+        inst = engine.instrumentation
 
         # Combat setup
         all_participants = [player] + enemies
-        self.combat_engine.log(f"=== COMBAT START ===")
-        self.combat_engine.log(f"Player: {player}")
-        self.combat_engine.log(f"Enemies: {len(enemies)}")
-        for i, enemy in enumerate(enemies, 1):
-            self.combat_engine.log(f"  {i}. {enemy}")
-        self.combat_engine.log("")
+        for combat_id, participant in enumerate(all_participants):
+            participant.combat_id = combat_id
+        if record_log:
+            combat_log.begin(all_participants)
+
+        if stream:
+            yield combat_log
 
+        scheduler = TurnScheduler(all_participants, engine.order_rng)
+        living_enemies = LivingSet(enemies) if large_battle else LivingList(enemies)
         round_count = 0
 
         # Main combat loop
         while round_count < max_rounds:
             round_count += 1
+            engine.current_round = round_count
 
             # Check win conditions
-            living_enemies = [e for e in enemies if e.is_alive]
             if not player.is_alive:
                 result = CombatResult.DEFEAT
                 break
@@ -52,67 +182,445 @@ class CombatSimulation:
                 result = CombatResult.VICTORY
                 break
 
-            if detailed_log:
-                self.combat_engine.log(f"--- Round {round_count} ---")
+            if engine.detailed_log:
+                combat_log.record(round_count, NO_PARTICIPANT, NO_PARTICIPANT,
+                                  EventKind.ROUND)
 
-            # Determine turn order (only living participants)
-            living_participants = [p for p in all_participants if p.is_alive]
-            turn_order = self.combat_engine.determine_turn_order(
-                living_participants)
+            # Turn order of the living participants
+            if inst is None:
+                turn_order = scheduler.next_round()
+            else:
+                inst.round_started(round_count)
+                started = perf_counter()
+                turn_order = scheduler.next_round()
+                inst.add_time('turn_order', perf_counter() - started)
 
             # Execute turns
             for character in turn_order:
                 if not character.is_alive:
                     continue
 
-                if character == player:
+                if character is player:
                     # Player attacks random living enemy
                     if living_enemies:
-                        target = random.choice(living_enemies)
-                        attack_result = self.combat_engine.attack(
-                            player, target)
-                        if detailed_log:
-                            self.combat_engine.log(attack_result["message"])
-
-                        # Update living enemies list
-                        living_enemies = [e for e in enemies if e.is_alive]
+                        target = living_enemies.choice(target_rng)
+                        engine.attack(player, target)
+                        if not target.is_alive:
+                            living_enemies.discard(target)
+                            scheduler.remove(target)
                 else:
                     # Enemy attacks player
                     if player.is_alive:
-                        attack_result = self.combat_engine.attack(
-                            character, player)
-                        if detailed_log:
-                            self.combat_engine.log(attack_result["message"])
+                        engine.attack(character, player)
 
                 # Process end-of-turn effects
-                self.combat_engine.process_turn(character)
+                engine.process_turn(character)
+
+                if stream:
+                    yield
 
                 # Check if combat ended this turn
-                if not player.is_alive or not any(e.is_alive for e in enemies):
+                if not player.is_alive or not living_enemies:
                     break
         else:
             # Max rounds reached
             result = CombatResult.ONGOING
-            self.combat_engine.log(
-                f"Combat ended after {max_rounds} rounds (timeout)")
+            if record_log:
+                combat_log.record(max_rounds, NO_PARTICIPANT, NO_PARTICIPANT,
+                                  EventKind.TIMEOUT)
 
         # Final results
-        living_enemies = [e for e in enemies if e.is_alive]
-
-        self.combat_engine.log(f"\n=== COMBAT END ===")
-        self.combat_engine.log(f"Result: {result.value.upper()}")
-        self.combat_engine.log(f"Rounds: {round_count}")
-        self.combat_engine.log(
-            f"Player HP: {player.current_hp}/{player.max_hp}")
-        self.combat_engine.log(
-            f"Enemies remaining: {len(living_enemies)}/{len(enemies)}")
+        living_count = len(living_enemies)
+        if record_log:
+            combat_log.finish(result, round_count, living_count)
 
-        return {
+        summary = {
             "result": result,
             "rounds": round_count,
             "player_final_hp": player.current_hp,
             "player_max_hp": player.max_hp,
-            "enemies_defeated": len(enemies) - len(living_enemies),
+            "enemies_defeated": len(enemies) - living_count,
             "total_enemies": len(enemies),
-            "combat_log": self.combat_engine.get_combat_log()
         }
+        if inst is not None:
+            inst.combat_finished(summary)
+        return summary
+
+    def simulate_many(self, player: Union[str, Character], enemies: List[Character],
+                      n: int, workers: Optional[int] = None,
+                      max_rounds: int = 100, backend: str = "python",
+                      seed: Optional[int] = None, first_trial: int = 0) -> Dict:
+        """
+        Run the same matchup n times spread across a process pool
+        Every worker fights on its own copies of the combatants.
+        backend selects the scalar CombatEngine ("python") or the lockstep
+        VectorizedCombatEngine ("numpy").
+        Trial i draws from the stream make_rng(seed, i), so results do not
+        depend on the number of workers, and any single trial can be replayed
+        with simulate_combat(..., rng=make_rng(seed, i)). The NumPy backend
+        draws one stream per batch instead. A fresh seed is drawn when none
+        is given; it is reported in the result.
+        With a cache attached, repeated requests for the same stats return
+        the stored result (including the seed it was run with).
+        Returns aggregated outcome counts, round histogram and HP statistics
+        """
+        player, error = self._resolve_player(player)
+        if error:
+            return error
+        if n < 1:
+            return {"error": "Number of trials must be at least 1"}
+        if backend not in BACKENDS:
+            return {"error": f"Unknown combat backend '{backend}'"}
+
+        cache_key = None
+        if self.cache is not None:
+            from result_cache import simulation_key
+            cache_key = simulation_key(player, enemies, max_rounds, n, backend,
+                                       seed, first_trial)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        if seed is None:
+            seed = new_root_seed()
+
+        player_data = player.to_dict()
+        enemy_data = [enemy.to_dict() for enemy in enemies]
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        stats = self._collect_stats(player_data, enemy_data, n, workers, max_rounds,
+                                    backend, seed, first_trial)
+        summary = _summarize_stats(stats, n)
+        summary["seed"] = seed
+        if cache_key is not None:
+            self.cache.put(cache_key, summary)
+        return summary
+
+    def simulate_adaptive(self, player: Union[str, Character], enemies: List[Character],
+                          target_half_width: float = 0.01,
+                          threshold: Optional[float] = None,
+                          confidence: float = 0.95, batch_size: int = 1000,
+                          max_trials: int = 100000, workers: Optional[int] = None,
+                          max_rounds: int = 100, backend: str = "python",
+                          seed: Optional[int] = None) -> Dict:
+        """
+        Estimate the win rate with as few trials as the question needs
+        Trials run in batches of batch_size until the Wilson interval for the
+        win rate is narrower than +/- target_half_width, or lies entirely on
+        one side of threshold when one is given, or max_trials is reached.
+        A seeded run is reproducible. With the python backend trials are
+        numbered as in simulate_many, so the first N trials match a seeded
+        simulate_many(n=N); the NumPy backend seeds its streams per batch, so
+        its results depend on batch_size.
+        Checking after every batch makes the interval slightly optimistic, so
+        pick confidence with that in mind.
+        Returns the simulate_many summary plus the interval, the rule that
+        stopped the run and the number of trials used
+        """
+        player, error = self._resolve_player(player)
+        if error:
+            return error
+        if batch_size < 1 or max_trials < 1:
+            return {"error": "Batch size and trial limit must be at least 1"}
+        if not 0 < confidence < 1:
+            return {"error": "Confidence must be between 0 and 1"}
+        if backend not in BACKENDS:
+            return {"error": f"Unknown combat backend '{backend}'"}
+        if seed is None:
+            seed = new_root_seed()
+
+        player_data = player.to_dict()
+        enemy_data = [enemy.to_dict() for enemy in enemies]
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        executor = None
+        if workers > 1:
+            # One pool for all batches instead of one per batch
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        stats = _empty_stats()
+        trials = 0
+        try:
+            while True:
+                count = min(batch_size, max_trials - trials)
+                _merge_stats(stats, self._collect_stats(
+                    player_data, enemy_data, count, workers, max_rounds, backend,
+                    seed, trials, executor))
+                trials += count
+
+                victories = stats["outcomes"][CombatResult.VICTORY.value]
+                low, high = wilson_interval(victories, trials, confidence)
+                if (high - low) / 2 <= target_half_width:
+                    stopped_by = "precision"
+                elif threshold is not None and (low > threshold or high < threshold):
+                    stopped_by = "threshold"
+                elif trials >= max_trials:
+                    stopped_by = "max_trials"
+                else:
+                    continue
+                break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        summary = _summarize_stats(stats, trials)
+        summary.update({
+            "seed": seed,
+            "confidence": confidence,
+            "win_rate_interval": (low, high),
+            "half_width": (high - low) / 2,
+            "stopped_by": stopped_by,
+        })
+        return summary
+
+    def simulate_paired(self, build_a: Union[str, Character], build_b: Union[str, Character],
+                        enemies: List[Character], n: int, workers: Optional[int] = None,
+                        max_rounds: int = 100, seed: Optional[int] = None) -> Dict:
+        """
+        Compare two builds against the same enemies with common random numbers
+        Trial i fights both builds with identical streams from
+        make_streams(seed, i): the same hit rolls, damage draws, turn-order
+        tie-breaks and target picks, in order. Luck then mostly cancels out of
+        the per-trial difference, so small differences show up in far fewer
+        trials than with independent runs.
+        Returns both win rates, their difference with its paired standard
+        error, and the standard error independent runs would have had
+        """
+        builds = []
+        for build in (build_a, build_b):
+            build, error = self._resolve_player(build)
+            if error:
+                return error
+            builds.append(build.to_dict())
+        if n < 2:
+            return {"error": "Number of trials must be at least 2"}
+        if seed is None:
+            seed = new_root_seed()
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        enemy_data = [enemy.to_dict() for enemy in enemies]
+        chunks = [(builds[0], builds[1], enemy_data, start, count, max_rounds, seed)
+                  for start, count in chunk_ranges(n, workers)]
+        totals = Counter()
+        for partial in run_chunks(_run_paired_trials, chunks, workers):
+            totals.update(partial)
+
+        win_rate_a = totals["wins_a"] / n
+        win_rate_b = totals["wins_b"] / n
+        # Per-trial difference is +1 (only A won), -1 (only B won) or 0
+        difference = (totals["only_a"] - totals["only_b"]) / n
+        variance = ((totals["only_a"] + totals["only_b"]) - n * difference ** 2) / (n - 1)
+        paired_se = math.sqrt(max(variance, 0.0) / n)
+        independent_se = math.sqrt((win_rate_a * (1 - win_rate_a)
+                                    + win_rate_b * (1 - win_rate_b)) / n)
+
+        hp_difference = totals["hp_diff"] / n
+        hp_variance = (totals["hp_diff_sq"] - n * hp_difference ** 2) / (n - 1)
+
+        return {
+            "trials": n,
+            "seed": seed,
+            "win_rate_a": win_rate_a,
+            "win_rate_b": win_rate_b,
+            "win_rate_difference": difference,
+            "paired_standard_error": paired_se,
+            "independent_standard_error": independent_se,
+            "discordant_trials": totals["only_a"] + totals["only_b"],
+            "hp_remaining_difference": hp_difference,
+            "hp_remaining_difference_se": math.sqrt(max(hp_variance, 0.0) / n),
+        }
+
+    def _collect_stats(self, player_data: Dict, enemy_data: List[Dict], n: int,
+                       workers: int, max_rounds: int, backend: str, seed: int,
+                       first_trial: int, executor=None) -> Dict:
+        """
+        Run trials first_trial..first_trial+n-1 and merge their counters
+        Uses executor when given, otherwise a pool of its own for workers > 1.
+        """
+        # Batches of the NumPy backend start at fixed offsets so their
+        # streams are reproducible
+        chunk_size = VECTORIZED_BATCH_SIZE if backend == "numpy" else None
+
+        # Workers keep their own counters and timers, merged in afterwards
+        inst = self.instrumentation
+        instrument = inst is not None and backend == "python"
+
+        chunks = [(player_data, enemy_data, start, count, max_rounds, backend, seed,
+                   instrument)
+                  for start, count in chunk_ranges(n, workers, first_trial, chunk_size)]
+        stats = _empty_stats()
+        for partial in run_chunks(run_trials, chunks, workers, executor):
+            _merge_stats(stats, partial, inst)
+        return stats
+
+    def _resolve_player(self, player: Union[str, Character]
+                        ) -> Tuple[Optional[Character], Optional[Dict]]:
+        """Look a player up by name; returns (character, error result)"""
+        if isinstance(player, str):
+            character = self.char_manager.get_character(player)
+            if not character:
+                return None, {"error": f"Player character '{player}' not found"}
+            return character, None
+        return player, None
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion"""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _run_to_end(fight) -> Dict:
+    """Drive a combat generator to completion and return its result"""
+    try:
+        while True:
+            next(fight)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _drain_events(combat_log, as_text: bool):
+    """Yield and forget the events recorded so far"""
+    events = combat_log.events
+    if as_text:
+        for event in events:
+            yield from combat_log.format_event(event)
+    else:
+        yield from events
+    events.clear()
+
+
+def _empty_stats() -> Dict:
+    """Create an empty partial result for a batch of trials"""
+    return {
+        "outcomes": Counter(),
+        "rounds": Counter(),
+        "player_hp": Counter(),
+    }
+
+
+def _merge_stats(total: Dict, partial: Dict, instrumentation=None):
+    """Fold a partial batch result (and its instrumentation) into the running total"""
+    for key in ("outcomes", "rounds", "player_hp"):
+        total[key].update(partial[key])
+    if instrumentation is not None and "instrumentation" in partial:
+        instrumentation.merge(partial["instrumentation"])
+
+
+def run_trials(player_data: Dict, enemy_data: List[Dict], start: int, count: int,
+               max_rounds: int = 100, backend: str = "python", seed: int = 0,
+               instrument: bool = False) -> Dict:
+    """
+    Run trials start..start+count-1 of one matchup in this process
+    Combatants are given as to_dict() data and fought as private copies, so
+    this is also the worker entry point of simulate_many. Returns Counters
+    of outcome values, rounds and final player HP (plus an instrumentation
+    snapshot when instrument is set).
+    """
+    if backend == "numpy":
+        return _run_trials_vectorized(player_data, enemy_data, start, count,
+                                      max_rounds, seed)
+
+    from character_manager import CharacterManager
+
+    manager = CharacterManager()
+    player = manager.create_character(**player_data)
+    enemies = [Character.from_dict(data) for data in enemy_data]
+    simulation = CombatSimulation(manager)
+    if instrument:
+        from instrumentation import Instrumentation
+        simulation.instrumentation = Instrumentation()
+
+    stats = _empty_stats()
+    outcomes = stats["outcomes"]
+    rounds = stats["rounds"]
+    player_hp = stats["player_hp"]
+    for trial in range(start, start + count):
+        result = simulation.simulate_combat(
+            player.name, enemies, max_rounds=max_rounds,
+            detailed_log=False, record_log=False, rng=make_rng(seed, trial))
+        outcomes[result["result"].value] += 1
+        rounds[result["rounds"]] += 1
+        player_hp[result["player_final_hp"]] += 1
+    if instrument:
+        stats["instrumentation"] = simulation.instrumentation.snapshot()
+    return stats
+
+
+def _run_paired_trials(build_a: Dict, build_b: Dict, enemy_data: List[Dict],
+                       start: int, count: int, max_rounds: int, seed: int) -> Counter:
+    """Worker entry point: fight trials start..start+count-1 with both builds"""
+    characters = (Character.from_dict(build_a), Character.from_dict(build_b))
+    enemies = [Character.from_dict(data) for data in enemy_data]
+    simulation = CombatSimulation(None)
+
+    totals = Counter()
+    for trial in range(start, start + count):
+        outcomes = []
+        for character in characters:
+            result = simulation.run_combat(
+                Combatant(character), [Combatant(enemy) for enemy in enemies],
+                max_rounds, detailed_log=False, record_log=False,
+                streams=make_streams(seed, trial))
+            outcomes.append((result["result"] == CombatResult.VICTORY,
+                             result["player_final_hp"]))
+        (won_a, hp_a), (won_b, hp_b) = outcomes
+        totals["wins_a"] += won_a
+        totals["wins_b"] += won_b
+        totals["only_a"] += won_a and not won_b
+        totals["only_b"] += won_b and not won_a
+        totals["hp_diff"] += hp_a - hp_b
+        totals["hp_diff_sq"] += (hp_a - hp_b) ** 2
+    return totals
+
+
+def _run_trials_vectorized(player_data: Dict, enemy_data: List[Dict], start: int,
+                           count: int, max_rounds: int, seed: int) -> Dict:
+    """Run one batch of fights through the lockstep NumPy engine"""
+    from vectorized_engine import VectorizedCombatEngine, RESULT_CODES
+
+    player = Character.from_dict(player_data)
+    enemies = [Character.from_dict(data) for data in enemy_data]
+
+    stats = _empty_stats()
+    engine = VectorizedCombatEngine.from_matchup(
+        player, enemies, count, rng=make_numpy_rng(seed, start))
+    batch = engine.simulate(max_rounds)
+    for code, result in RESULT_CODES.items():
+        stats["outcomes"][result.value] += int((batch["result"] == code).sum())
+    stats["rounds"].update(batch["rounds"].tolist())
+    stats["player_hp"].update(batch["player_final_hp"].tolist())
+    return stats
+
+
+def _summarize_stats(stats: Dict, n: int) -> Dict:
+    """Turn merged counters into the public batch result"""
+    outcomes = stats["outcomes"]
+    player_hp = stats["player_hp"]
+
+    hp_mean = sum(hp * count for hp, count in player_hp.items()) / n
+    hp_variance = sum(count * (hp - hp_mean) ** 2
+                      for hp, count in player_hp.items()) / n
+
+    return {
+        "trials": n,
+        "victories": outcomes[CombatResult.VICTORY.value],
+        "defeats": outcomes[CombatResult.DEFEAT.value],
+        "timeouts": outcomes[CombatResult.ONGOING.value],
+        "win_rate": outcomes[CombatResult.VICTORY.value] / n,
+        "round_histogram": dict(sorted(stats["rounds"].items())),
+        "hp_remaining": {
+            "mean": hp_mean,
+            "stdev": hp_variance ** 0.5,
+            "min": min(player_hp),
+            "max": max(player_hp),
+            "histogram": dict(sorted(player_hp.items())),
+        },
+    }
@@ -0,0 +1,107 @@
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from combat_engine import damage_distribution, hit_chance_for
+
+
+def _kill_time_distribution(hit_chance: float, damage: List[Tuple[int, float]],
+                            target_hp: int, swings: int) -> List[float]:
+    """
+    Probability that the target dies on exactly the t-th swing, t = 0..swings
+    Each swing hits with hit_chance and deals damage from the given distribution.
+    """
+    kill_at = [0.0] * (swings + 1)
+    if target_hp <= 0:
+        kill_at[0] = 1.0
+        return kill_at
+
+    # alive[hp] = probability the target is alive with hp remaining
+    alive = [0.0] * (target_hp + 1)
+    alive[target_hp] = 1.0
+    miss_chance = 1.0 - hit_chance
+    for swing in range(1, swings + 1):
+        next_alive = [p * miss_chance for p in alive]
+        killed = 0.0
+        for hp in range(1, target_hp + 1):
+            p = alive[hp]
+            if p == 0.0:
+                continue
+            for amount, p_amount in damage:
+                p_hit = p * hit_chance * p_amount
+                if amount >= hp:
+                    killed += p_hit
+                else:
+                    next_alive[hp - amount] += p_hit
+        kill_at[swing] = killed
+        alive = next_alive
+    return kill_at
+
+
+@lru_cache(maxsize=4096)
+def _solve(player: Tuple[int, int, int, int], enemy: Tuple[int, int, int, int],
+           max_rounds: int) -> Tuple[float, float, float, float]:
+    """Solve one duel from (STR, DEX, AGI, HP) stat tuples"""
+    p_str, p_dex, p_agi, p_hp = player
+    e_str, e_dex, e_agi, e_hp = enemy
+
+    # Win conditions are checked before anyone acts
+    if p_hp <= 0:
+        return 0.0, 1.0, 0.0, 1.0
+    if e_hp <= 0:
+        return 1.0, 0.0, 0.0, 1.0
+
+    # Each side swings once per round while alive, so the round in which
+    # each side would land the killing blow is independent of the other side.
+    # A fight decided in round t is only detected at the start of round t + 1,
+    # so only rounds 1..max_rounds-1 can produce a victory or defeat.
+    decisive_rounds = max_rounds - 1
+    player_kills = _kill_time_distribution(
+        hit_chance_for(p_dex - e_dex), damage_distribution(p_str), e_hp, decisive_rounds)
+    enemy_kills = _kill_time_distribution(
+        hit_chance_for(e_dex - p_dex), damage_distribution(e_str), p_hp, decisive_rounds)
+
+    # Chance the player acts first in a round (ties broken at random)
+    if p_agi > e_agi:
+        player_first = 1.0
+    elif p_agi < e_agi:
+        player_first = 0.0
+    else:
+        player_first = 0.5
+
+    victory = defeat = expected_rounds = 0.0
+    player_survives = enemy_survives = 1.0  # P(still alive after round t)
+    for t in range(1, decisive_rounds + 1):
+        p_kill, e_kill = player_kills[t], enemy_kills[t]
+        enemy_survives -= p_kill
+        player_survives -= e_kill
+        # Both blows due in the same round: whoever acts first wins
+        win = p_kill * (player_survives + player_first * e_kill)
+        loss = e_kill * (enemy_survives + (1.0 - player_first) * p_kill)
+        victory += win
+        defeat += loss
+        expected_rounds += (win + loss) * (t + 1)
+
+    timeout = max(0.0, 1.0 - victory - defeat)
+    expected_rounds += timeout * max_rounds
+    return victory, defeat, timeout, expected_rounds
+
+
+def duel_outcome_distribution(a, b, max_rounds: int = 100) -> Dict:
+    """
+    Exact outcome probabilities of simulate_combat for a 1v1 fight
+    a is the player and b the enemy; both start at full HP.
+    Results are memoized by the stats that matter for combat.
+    """
+    if max_rounds < 1:
+        raise ValueError("max_rounds must be at least 1")
+
+    victory, defeat, timeout, expected_rounds = _solve(
+        (a.strength, a.dexterity, a.agility, a.max_hp),
+        (b.strength, b.dexterity, b.agility, b.max_hp),
+        max_rounds)
+
+    return {
+        "victory": victory,
+        "defeat": defeat,
+        "timeout": timeout,
+        "expected_rounds": expected_rounds,
+    }
@@ -1,16 +1,26 @@
 import random
-from typing import List
+from typing import Dict, List, Optional
+from models import Character, Combatant, CombatResult
+from tournament import run_tournaments, tournament_rounds
 
 
 class GameModes:
     """Special game modes like quick battle and tournament"""
 
-    def __init__(self, char_manager, combat_sim):
+    def __init__(self, char_manager, combat_sim, rng: Optional[random.Random] = None):
         self.char_manager = char_manager
         self.combat_sim = combat_sim
+        # Random stream for encounter generation and the fights themselves
+        self.rng = rng if rng is not None else combat_sim.rng
         from ui_helpers import UIHelpers  # Fixed: import here
         self.ui = UIHelpers()
 
+    def run_tournaments(self, player_names: List[str], rounds: int, repetitions: int,
+                        workers: Optional[int] = None, seed: Optional[int] = None) -> Dict:
+        """Run many non-interactive tournaments per character (see tournament.run_tournaments)"""
+        return run_tournaments(self.char_manager, player_names, rounds, repetitions,
+                               workers=workers, seed=seed)
+
     def quick_battle(self):
         """Quick random battle"""
         players = self.char_manager.list_characters()
@@ -30,23 +40,23 @@ class GameModes:
         player_name = players[player_choice - 1]
 
         # Generate random enemies
-        enemy_count = random.randint(1, 4)
+        enemy_count = self.rng.randint(1, 4)
         random_enemies = []
 
         enemy_templates = ["Goblin", "Orc", "Skeleton", "Wolf", "Bandit"]
 
         for i in range(enemy_count):
-            enemy_type = random.choice(enemy_templates)
+            enemy_type = self.rng.choice(enemy_templates)
             enemy = Character(
                 name=f"{enemy_type}_{i+1}",
                 title=enemy_type,
-                level=random.randint(1, 5),
-                strength=random.randint(6, 15),
-                dexterity=random.randint(6, 15),
-                intelligence=random.randint(4, 12),
-                wisdom=random.randint(4, 12),
-                agility=random.randint(6, 15),
-                constitution=random.randint(6, 15)
+                level=self.rng.randint(1, 5),
+                strength=self.rng.randint(6, 15),
+                dexterity=self.rng.randint(6, 15),
+                intelligence=self.rng.randint(4, 12),
+                wisdom=self.rng.randint(4, 12),
+                agility=self.rng.randint(6, 15),
+                constitution=self.rng.randint(6, 15)
             )
             random_enemies.append(enemy)
 
@@ -55,7 +65,7 @@ class GameModes:
             print(f"  {enemy.get_display_name()}")
 
         result = self.combat_sim.simulate_combat(
-            player_name, random_enemies, detailed_log=False)
+            player_name, random_enemies, detailed_log=False, rng=self.rng)
 
         print(f"\nBattle Result: {result['result'].value.upper()}")
         print(f"Rounds: {result['rounds']}")
@@ -88,42 +98,18 @@ class GameModes:
         wins = 0
         losses = 0
 
-        for round_num in range(1, rounds + 1):
+        # Fight on a runtime copy so damage carries from round to round
+        fighter = Combatant(player)
+        for round_num, enemies, result in tournament_rounds(
+                self.combat_sim, fighter, rounds, self.rng):
             print(f"\n{'='*40}")
             print(f"TOURNAMENT ROUND {round_num}")
             print(f"{'='*40}")
 
-            # Generate enemies for this round
-            enemy_count = random.randint(1, 3)
-            difficulty = min(round_num, 5)  # Difficulty scales with rounds
-
-            enemies = []
-            for i in range(enemy_count):
-                enemy_name = f"Round{round_num}_Enemy{i+1}"
-                stat_min = 6 + difficulty
-                stat_max = 12 + difficulty
-                level_range = (1, 2 + difficulty)
-
-                enemy = Character(
-                    name=enemy_name,
-                    level=random.randint(*level_range),
-                    strength=random.randint(stat_min, stat_max),
-                    dexterity=random.randint(stat_min, stat_max),
-                    intelligence=random.randint(stat_min-2, stat_max-2),
-                    wisdom=random.randint(stat_min-2, stat_max-2),
-                    agility=random.randint(stat_min, stat_max),
-                    constitution=random.randint(stat_min, stat_max)
-                )
-                enemies.append(enemy)
-
-            print(f"Facing {enemy_count} enemies:")
+            print(f"Facing {len(enemies)} enemies:")
             for enemy in enemies:
                 print(f"  {enemy}")
 
-            # Run combat
-            result = self.combat_sim.simulate_combat(
-                player_name, enemies, detailed_log=False)
-
             if result['result'] == CombatResult.VICTORY:
                 wins += 1
                 print(f"🎉 ROUND {round_num} - VICTORY!")
@@ -137,9 +123,7 @@ class GameModes:
 
             if round_num < rounds:
                 # Heal player partially between rounds
-                heal_amount = player.max_hp // 4  # Heal 25%
-                player.heal(heal_amount)
-                print(f"Player heals {heal_amount} HP between rounds")
+                print(f"Player heals {fighter.max_hp // 4} HP between rounds")
 
         print(f"\n{'='*40}")
         print("TOURNAMENT RESULTS")
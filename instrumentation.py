@@ -0,0 +1,121 @@
+from collections import Counter
+from typing import Callable, Dict, List
+
+
+# Counters kept by Instrumentation, in snapshot order
+COUNTERS = ('combats', 'rounds', 'attacks', 'hits', 'misses', 'kills', 'mana_regens')
+
+# Timed sections; attack time includes the logging it does
+TIMERS = ('turn_order', 'attack', 'logging')
+
+# Events hooks can subscribe to, with the arguments they receive
+HOOK_EVENTS = {
+    'round': ('round_number',),
+    'attack': ('attacker', 'defender', 'result'),
+    'kill': ('attacker', 'defender'),
+    'mana_regen': ('character', 'amount'),
+    'combat_end': ('summary',),
+}
+
+
+class Instrumentation:
+    """
+    Opt-in counters, timers and hooks for CombatEngine and CombatSimulation
+
+    Attach one with CombatSimulation(..., instrumentation=Instrumentation())
+    or by setting CombatEngine.instrumentation. While none is attached the
+    engine only pays for one attribute read and None check per call.
+    Timers use the monotonic perf_counter clock.
+    """
+
+    def __init__(self):
+        self.counters = Counter({name: 0 for name in COUNTERS})
+        self.timer_seconds = {name: 0.0 for name in TIMERS}
+        self.timer_calls = {name: 0 for name in TIMERS}
+        self.hooks: Dict[str, List[Callable]] = {}
+
+    # Hook interface
+
+    def add_hook(self, event: str, callback: Callable):
+        """Call callback with the event's arguments (see HOOK_EVENTS) whenever it happens"""
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unknown instrumentation event '{event}'")
+        self.hooks.setdefault(event, []).append(callback)
+
+    def remove_hook(self, event: str, callback: Callable):
+        """Stop calling a hook added with add_hook"""
+        callbacks = self.hooks.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self.hooks.pop(event, None)
+
+    def emit(self, event: str, *args):
+        for callback in self.hooks.get(event, ()):
+            callback(*args)
+
+    # Measurements reported by the engine and simulation
+
+    def add_time(self, timer: str, seconds: float):
+        self.timer_seconds[timer] += seconds
+        self.timer_calls[timer] += 1
+
+    def round_started(self, round_number: int):
+        self.counters['rounds'] += 1
+        if self.hooks:
+            self.emit('round', round_number)
+
+    def attack_resolved(self, attacker, defender, result: Dict, seconds: float):
+        counters = self.counters
+        counters['attacks'] += 1
+        if result["hit"]:
+            counters['hits'] += 1
+            if not defender.is_alive:
+                counters['kills'] += 1
+                if self.hooks:
+                    self.emit('kill', attacker, defender)
+        else:
+            counters['misses'] += 1
+        self.add_time('attack', seconds)
+        if self.hooks:
+            self.emit('attack', attacker, defender, result)
+
+    def mana_regenerated(self, character, amount: int):
+        self.counters['mana_regens'] += 1
+        if self.hooks:
+            self.emit('mana_regen', character, amount)
+
+    def combat_finished(self, summary: Dict):
+        self.counters['combats'] += 1
+        if self.hooks:
+            self.emit('combat_end', summary)
+
+    # Reporting
+
+    def snapshot(self) -> Dict:
+        """Current counters and timers as a plain dict"""
+        return {
+            "counters": dict(self.counters),
+            "timers": {
+                name: {
+                    "calls": self.timer_calls[name],
+                    "total_seconds": self.timer_seconds[name],
+                    "mean_seconds": (self.timer_seconds[name] / self.timer_calls[name]
+                                     if self.timer_calls[name] else 0.0),
+                }
+                for name in TIMERS
+            },
+        }
+
+    def merge(self, snapshot: Dict):
+        """Add a snapshot taken elsewhere (e.g. in a worker process)"""
+        self.counters.update(snapshot["counters"])
+        for name, timer in snapshot["timers"].items():
+            self.timer_seconds[name] += timer["total_seconds"]
+            self.timer_calls[name] += timer["calls"]
+
+    def reset(self):
+        """Zero all counters and timers (hooks stay registered)"""
+        self.counters = Counter({name: 0 for name in COUNTERS})
+        self.timer_seconds = {name: 0.0 for name in TIMERS}
+        self.timer_calls = {name: 0 for name in TIMERS}
@@ -5,17 +5,26 @@ Combat Simulator - Main Entry Point
 A turn-based combat simulation system with character management,
 enemy creation, and various game modes.
 
+Without arguments the interactive menu starts. Subcommands (simulate,
+matrix, tournament, generate, bench) run batch jobs from roster files and
+print JSON to stdout without touching the interactive UI.
+
 Author: Combat Simulator Team
 Version: 1.0
 """
 
-from user_interface import UserInterface
+import argparse
+import contextlib
+import json
+import os
+import sys
 
 
 def main():
     """Main entry point for the Combat Simulator application"""
     print("Starting Combat Simulator...")
     try:
+        from user_interface import UserInterface
         ui = UserInterface()
         ui.main_menu()
     except KeyboardInterrupt:
@@ -25,5 +34,200 @@ def main():
         print("Please report this issue.")
 
 
+def load_roster(path: str):
+    """
+    Load a JSON or binary (.bin) roster file into a new CharacterManager
+    A JSON roster left with a change journal by the interactive menu is
+    read with the journal replayed.
+    """
+    from character_manager import CharacterManager
+
+    journaled = any(os.path.exists(path + suffix)
+                    for suffix in (".journal", ".journal.compacting"))
+    if not os.path.exists(path) and not journaled:
+        raise SystemExit(_emit({"error": f"Roster file '{path}' not found"}))
+    manager = CharacterManager()
+    if path.endswith(".bin"):
+        manager.load_binary(path)
+    elif journaled:
+        # Read-only replay; the menu may still be appending to the journal
+        from character_storage import read_journaled_roster
+        for name, title, values in read_journaled_roster(path):
+            manager.roster.add_values(name, title, values)
+    else:
+        # Loader warnings must not end up in the JSON on stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            manager.load_from_file(path)
+    return manager
+
+
+def _emit(result) -> int:
+    """Print a result as JSON; error results give a non-zero exit status"""
+    json.dump(result, sys.stdout, indent=2, default=_to_json)
+    print()
+    return 1 if isinstance(result, dict) and "error" in result else 0
+
+
+def _to_json(value):
+    """JSON fallback for enums and NumPy values in results"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "value"):
+        return value.value
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def cmd_simulate(args) -> int:
+    """Run one player against a group of enemies many times"""
+    from combat_simulation import CombatSimulation
+
+    players = load_roster(args.roster)
+    enemy_manager = load_roster(args.enemies)
+    names = args.enemy or enemy_manager.list_characters()
+    enemies = []
+    for name in names:
+        enemy = enemy_manager.get_character(name)
+        if not enemy:
+            return _emit({"error": f"Enemy '{name}' not found"})
+        enemies.append(enemy)
+
+    cache = None
+    if args.cache:
+        from result_cache import SimulationCache
+        cache = SimulationCache(args.cache)
+    simulation = CombatSimulation(players, cache=cache)
+    try:
+        result = simulation.simulate_many(
+            args.player, enemies, args.trials,
+            workers=args.workers, max_rounds=args.max_rounds, backend=args.backend,
+            seed=args.seed)
+    finally:
+        if cache is not None:
+            cache.close()
+    if "error" not in result:
+        result = dict(player=args.player, enemies=names, **result)
+    return _emit(result)
+
+
+def cmd_matrix(args) -> int:
+    """Win rate, mean rounds and mean HP left for every player vs every enemy"""
+    from matchup import MatchupMatrix
+
+    matrix = MatchupMatrix(load_roster(args.roster), load_roster(args.enemies),
+                           seed=args.seed)
+    result = matrix.compute(args.player, args.enemy, args.trials, workers=args.workers,
+                            max_rounds=args.max_rounds)
+    return _emit(result)
+
+
+def cmd_tournament(args) -> int:
+    """Distribution of tournament rounds survived per player"""
+    from tournament import run_tournaments
+
+    players = load_roster(args.roster)
+    names = args.player or players.list_characters()
+    result = run_tournaments(players, names, args.rounds, args.repetitions,
+                             workers=args.workers, seed=args.seed,
+                             max_rounds=args.max_rounds)
+    return _emit(result)
+
+
+def cmd_generate(args) -> int:
+    """Write a roster of random characters"""
+    import random
+    from character_manager import CharacterManager
+
+    manager = CharacterManager()
+    rng = random.Random(args.seed) if args.seed is not None else None
+    manager.create_random_characters(args.base_name, args.count, tuple(args.stat_range),
+                                     tuple(args.level_range), rng=rng)
+    if args.output.endswith(".bin"):
+        manager.save_binary(args.output)
+    else:
+        manager.save_to_file(args.output)
+    return _emit({"output": args.output, "characters": args.count})
+
+
+def cmd_bench(args) -> int:
+    """Run the benchmark suite (arguments are passed on to python -m benchmarks)"""
+    from benchmarks.__main__ import main as bench_main
+    return bench_main(args.bench_args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Combat Simulator. Run without a command for the interactive menu.")
+    commands = parser.add_subparsers(dest="command")
+
+    def add_common(command):
+        command.add_argument("--roster", default="characters.json",
+                             help="player roster file (.json or .bin)")
+        command.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+        command.add_argument("--seed", type=int, help="root seed for reproducible runs")
+        command.add_argument("--max-rounds", type=int, default=100,
+                             help="combat rounds before a fight times out")
+
+    simulate = commands.add_parser("simulate", help=cmd_simulate.__doc__)
+    add_common(simulate)
+    simulate.add_argument("--enemies", default="enemies.json", help="enemy roster file")
+    simulate.add_argument("--player", required=True, help="player character name")
+    simulate.add_argument("--enemy", action="append",
+                          help="enemy name, repeatable (default: every enemy)")
+    simulate.add_argument("--trials", type=int, default=1000)
+    simulate.add_argument("--backend", default="python", choices=("python", "numpy"))
+    simulate.add_argument("--cache", metavar="PATH",
+                          help="SQLite file caching simulation results across runs")
+    simulate.set_defaults(handler=cmd_simulate)
+
+    matrix = commands.add_parser("matrix", help=cmd_matrix.__doc__)
+    add_common(matrix)
+    matrix.add_argument("--enemies", default="enemies.json", help="enemy roster file")
+    matrix.add_argument("--player", action="append",
+                        help="player name, repeatable (default: every player)")
+    matrix.add_argument("--enemy", action="append",
+                        help="enemy name, repeatable (default: every enemy)")
+    matrix.add_argument("--trials", type=int, default=1000)
+    matrix.set_defaults(handler=cmd_matrix)
+
+    tournament = commands.add_parser("tournament", help=cmd_tournament.__doc__)
+    add_common(tournament)
+    tournament.add_argument("--player", action="append",
+                            help="player name, repeatable (default: every player)")
+    tournament.add_argument("--rounds", type=int, default=5)
+    tournament.add_argument("--repetitions", type=int, default=1000)
+    tournament.set_defaults(handler=cmd_tournament)
+
+    generate = commands.add_parser("generate", help=cmd_generate.__doc__)
+    generate.add_argument("--output", required=True,
+                          help="roster file to write (.bin for the binary format)")
+    generate.add_argument("--base-name", default="Enemy")
+    generate.add_argument("--count", type=int, default=100)
+    generate.add_argument("--stat-range", type=int, nargs=2, default=(8, 15),
+                          metavar=("MIN", "MAX"))
+    generate.add_argument("--level-range", type=int, nargs=2, default=(1, 5),
+                          metavar=("MIN", "MAX"))
+    generate.add_argument("--seed", type=int, help="seed for reproducible rosters")
+    generate.set_defaults(handler=cmd_generate)
+
+    bench = commands.add_parser("bench", help=cmd_bench.__doc__, add_help=False)
+    bench.set_defaults(handler=cmd_bench)
+
+    return parser
+
+
+def run(argv=None) -> int:
+    """Dispatch to a batch subcommand, or start the interactive menu"""
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if args.command is None:
+        main()
+        return 0
+    return args.handler(args)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(run())
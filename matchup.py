@@ -0,0 +1,113 @@
+import os
+from typing import Dict, List, Optional, Tuple
+from models import CombatResult
+from combat_simulation import run_trials
+from result_cache import stat_signature
+from rng_streams import new_root_seed
+from worker_pool import chunk_ranges, run_chunks
+
+
+# Values stored per cell, in the order of the matrix's last axis
+METRICS = ("win_rate", "mean_rounds", "mean_hp_remaining")
+
+
+class MatchupMatrix:
+    """
+    All-pairs player vs enemy win rates
+
+    Every cell is one player fighting one enemy for a number of trials.
+    Cells are cached by the stat signatures of both sides, so after an
+    edit only the cells involving the changed character are fought again.
+    All cells share one root seed, drawn once per matrix unless given.
+    """
+
+    def __init__(self, char_manager, enemy_manager, seed: Optional[int] = None):
+        self.char_manager = char_manager
+        self.enemy_manager = enemy_manager
+        self.seed = seed if seed is not None else new_root_seed()
+        # (player signature, enemy signature, trials, max_rounds) -> metrics
+        self.cache: Dict[Tuple, Tuple[float, ...]] = {}
+
+    def compute(self, players: Optional[List[str]] = None,
+                enemies: Optional[List[str]] = None, trials: int = 1000,
+                workers: Optional[int] = None, max_rounds: int = 100) -> Dict:
+        """
+        Fill the matrix for the given players and enemies (default: all)
+        Uncached cells are spread across a process pool.
+        Returns names of both axes and a (players, enemies, METRICS) array
+        """
+        import numpy as np
+
+        if trials < 1:
+            return {"error": "Number of trials must be at least 1"}
+        if players is None:
+            players = self.char_manager.list_characters()
+        if enemies is None:
+            enemies = self.enemy_manager.list_characters()
+
+        player_chars = []
+        for name in players:
+            char = self.char_manager.get_character(name)
+            if not char:
+                return {"error": f"Player character '{name}' not found"}
+            player_chars.append(char)
+        enemy_chars = []
+        for name in enemies:
+            char = self.enemy_manager.get_character(name)
+            if not char:
+                return {"error": f"Enemy '{name}' not found"}
+            enemy_chars.append(char)
+
+        # Collect each missing signature pair once
+        missing = {}
+        for player in player_chars:
+            for enemy in enemy_chars:
+                key = (stat_signature(player), stat_signature(enemy), trials, max_rounds)
+                if key not in self.cache and key not in missing:
+                    missing[key] = (player.to_dict(), enemy.to_dict())
+
+        if missing:
+            self._fight_cells(missing, trials, max_rounds, workers)
+
+        matrix = np.empty((len(player_chars), len(enemy_chars), len(METRICS)))
+        for i, player in enumerate(player_chars):
+            for j, enemy in enumerate(enemy_chars):
+                matrix[i, j] = self.cache[
+                    (stat_signature(player), stat_signature(enemy), trials, max_rounds)]
+
+        return {
+            "players": list(players),
+            "enemies": list(enemies),
+            "metrics": METRICS,
+            "matrix": matrix,
+            "cells_computed": len(missing),
+            "seed": self.seed,
+        }
+
+    def _fight_cells(self, missing: Dict[Tuple, Tuple[Dict, Dict]], trials: int,
+                     max_rounds: int, workers: Optional[int]):
+        """Fight the missing cells and store them in the cache"""
+        if workers is None:
+            workers = os.cpu_count() or 1
+        keys = list(missing)
+        chunks = [keys[start:start + count]
+                  for start, count in chunk_ranges(len(keys), workers)]
+        results = run_chunks(_run_cells, [([missing[key] for key in chunk], trials,
+                                           max_rounds, self.seed) for chunk in chunks],
+                             workers)
+        for chunk, chunk_results in zip(chunks, results):
+            self.cache.update(zip(chunk, chunk_results))
+
+
+def _run_cells(cells: List[Tuple[Dict, Dict]], trials: int, max_rounds: int,
+               seed: int) -> List[Tuple[float, ...]]:
+    """Worker entry point: fight a group of one-on-one cells"""
+    results = []
+    for player_data, enemy_data in cells:
+        stats = run_trials(player_data, [enemy_data], 0, trials, max_rounds,
+                           seed=seed)
+        win_rate = stats["outcomes"][CombatResult.VICTORY.value] / trials
+        mean_rounds = sum(rounds * count for rounds, count in stats["rounds"].items()) / trials
+        mean_hp = sum(hp * count for hp, count in stats["player_hp"].items()) / trials
+        results.append((win_rate, mean_rounds, mean_hp))
+    return results
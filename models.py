@@ -110,6 +110,77 @@ class Character:
                 f"HP:{self.current_hp}/{self.max_hp} MP:{self.current_mana}/{self.max_mana}")
 
 
+class Combatant:
+    """
+    Runtime combat state for one fighter, built from a Character
+    Derived stats are computed once up front and only HP/mana change during
+    combat, so the stored Character is never modified.
+    """
+
+    __slots__ = ('name', 'title', 'level',
+                 'strength', 'dexterity', 'intelligence',
+                 'wisdom', 'agility', 'constitution',
+                 'max_hp', 'max_mana', 'mana_regen',
+                 'current_hp', 'current_mana', 'combat_id')
+
+    def __init__(self, char, combat_id: int = 0):
+        self.name = char.name
+        self.title = char.title
+        self.level = char.level
+        self.strength = char.strength
+        self.dexterity = char.dexterity
+        self.intelligence = char.intelligence
+        self.wisdom = char.wisdom
+        self.agility = char.agility
+        self.constitution = char.constitution
+        self.max_hp = char.max_hp
+        self.max_mana = char.max_mana
+        self.mana_regen = char.mana_regen
+        self.current_hp = self.max_hp
+        self.current_mana = self.max_mana
+        # Position in the combat's participant list, used by the event log
+        self.combat_id = combat_id
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if combatant is still alive"""
+        return self.current_hp > 0
+
+    def heal(self, amount: int) -> int:
+        """Heal combatant and return actual amount healed"""
+        old_hp = self.current_hp
+        self.current_hp = min(self.max_hp, self.current_hp + amount)
+        return self.current_hp - old_hp
+
+    def take_damage(self, damage: int) -> int:
+        """Apply damage and return actual damage taken"""
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp = max(0, self.current_hp - damage)
+        return actual_damage
+
+    def regenerate_mana(self) -> int:
+        """Regenerate mana, return amount regenerated"""
+        old_mana = self.current_mana
+        self.current_mana = min(
+            self.max_mana, self.current_mana + self.mana_regen)
+        return self.current_mana - old_mana
+
+    def spend_mana(self, amount: int) -> bool:
+        """Try to spend mana, return True if successful"""
+        if self.current_mana >= amount:
+            self.current_mana -= amount
+            return True
+        return False
+
+    def reset_to_full(self):
+        """Reset HP and mana to maximum"""
+        self.current_hp = self.max_hp
+        self.current_mana = self.max_mana
+
+    get_display_name = Character.get_display_name
+    __str__ = Character.__str__
+
+
 # combat_engine.py - Fixed version
 
 
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from character_roster import STAT_FIELDS
+from combat_engine import ENGINE_VERSION
+
+
+def stat_signature(char) -> Tuple[int, ...]:
+    """Combat-relevant stats of a character, used as a cache key"""
+    return tuple(getattr(char, field) for field in STAT_FIELDS)
+
+
+def simulation_key(player, enemies: List, max_rounds: int, trials: int,
+                   backend: str = "python", seed: Optional[int] = None,
+                   first_trial: int = 0) -> str:
+    """
+    Canonical hash of a batch simulation request
+    Names and titles do not affect combat and enemy order only changes which
+    random draws go where, so the key uses stats only, with enemies sorted.
+    """
+    request = {
+        "engine": ENGINE_VERSION,
+        "player": stat_signature(player),
+        "enemies": sorted(stat_signature(enemy) for enemy in enemies),
+        "max_rounds": max_rounds,
+        "trials": trials,
+        "backend": backend,
+        "seed": seed,
+        "first_trial": first_trial if seed is not None else 0,
+    }
+    encoded = json.dumps(request, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class SimulationCache:
+    """
+    Two-tier cache of simulation results by simulation_key
+
+    A size-bounded in-memory LRU sits in front of an optional SQLite file,
+    so results survive process restarts. Disk hits are promoted into the LRU.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            with self.connection:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up a result, None on a miss"""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory.move_to_end(key)
+        elif self.connection is not None:
+            row = self.connection.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                value = pickle.loads(row[0])
+                self._remember(key, value)
+
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Hand out copies so callers cannot change the cached result
+        return pickle.loads(pickle.dumps(value))
+
+    def put(self, key: str, value: Dict):
+        """Store a result in both tiers"""
+        value = pickle.loads(pickle.dumps(value))
+        self._remember(key, value)
+        if self.connection is not None:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(value)))
+
+    def clear(self):
+        """Drop every cached result from both tiers"""
+        self.memory.clear()
+        if self.connection is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM results")
+
+    def close(self):
+        """Close the disk tier"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _remember(self, key: str, value: Dict):
+        """Insert into the LRU tier, evicting the least recently used entries"""
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
@@ -0,0 +1,43 @@
+import hashlib
+import random
+import secrets
+from typing import Dict
+
+
+# Kinds of random draw in a fight, each with its own stream in paired runs
+STREAM_PURPOSES = ('hit', 'damage', 'order', 'target')
+
+
+def new_root_seed() -> int:
+    """Draw a fresh 64-bit root seed from the OS entropy pool"""
+    return secrets.randbits(64)
+
+
+def derive_seed(root_seed: int, *path: int) -> int:
+    """
+    Derive the seed of the stream at path under root_seed
+    Like numpy's SeedSequence.spawn, every (root_seed, path) pair gets its own
+    well-mixed 128-bit seed, so sibling streams never share state no matter
+    which process creates them.
+    """
+    key = ":".join(str(part) for part in (root_seed,) + path)
+    digest = hashlib.blake2b(key.encode(), digest_size=16,
+                             person=b"cadena-rng").digest()
+    return int.from_bytes(digest, "little")
+
+
+def make_rng(root_seed: int, *path: int) -> random.Random:
+    """Create the random.Random stream at path under root_seed"""
+    return random.Random(derive_seed(root_seed, *path))
+
+
+def make_numpy_rng(root_seed: int, *path: int):
+    """Create the NumPy Generator stream at path under root_seed (requires NumPy)"""
+    import numpy as np
+    return np.random.default_rng(np.random.SeedSequence(root_seed, spawn_key=path))
+
+
+def make_streams(root_seed: int, *path: int) -> Dict[str, random.Random]:
+    """Create one random.Random stream per STREAM_PURPOSES entry under path"""
+    return {purpose: make_rng(root_seed, *path, index)
+            for index, purpose in enumerate(STREAM_PURPOSES)}
@@ -0,0 +1,126 @@
+import os
+import random
+from collections import Counter
+from typing import Dict, List, Optional
+from models import Character, Combatant, CombatResult
+from combat_simulation import CombatSimulation
+from rng_streams import make_rng, new_root_seed
+from worker_pool import chunk_ranges, run_chunks
+
+
+def tournament_enemies(round_num: int, rng: random.Random) -> List[Character]:
+    """Generate the enemy group for one tournament round"""
+    enemy_count = rng.randint(1, 3)
+    difficulty = min(round_num, 5)  # Difficulty scales with rounds
+
+    enemies = []
+    for i in range(enemy_count):
+        enemy_name = f"Round{round_num}_Enemy{i+1}"
+        stat_min = 6 + difficulty
+        stat_max = 12 + difficulty
+        level_range = (1, 2 + difficulty)
+
+        enemy = Character(
+            name=enemy_name,
+            level=rng.randint(*level_range),
+            strength=rng.randint(stat_min, stat_max),
+            dexterity=rng.randint(stat_min, stat_max),
+            intelligence=rng.randint(stat_min-2, stat_max-2),
+            wisdom=rng.randint(stat_min-2, stat_max-2),
+            agility=rng.randint(stat_min, stat_max),
+            constitution=rng.randint(stat_min, stat_max)
+        )
+        enemies.append(enemy)
+    return enemies
+
+
+def tournament_rounds(simulation: CombatSimulation, player: Combatant, rounds: int,
+                      rng: random.Random, max_rounds: int = 100):
+    """
+    Play one tournament, yielding (round_num, enemies, result) after each fight
+    The player keeps their damage from round to round and heals 25% of max HP
+    between rounds. The tournament ends on the first fight not won.
+    """
+    for round_num in range(1, rounds + 1):
+        enemies = tournament_enemies(round_num, rng)
+        result = simulation.run_combat(
+            player, [Combatant(enemy) for enemy in enemies], max_rounds,
+            detailed_log=False, record_log=False, rng=rng)
+        yield round_num, enemies, result
+
+        if result['result'] != CombatResult.VICTORY:
+            return
+        if round_num < rounds:
+            player.heal(player.max_hp // 4)  # Heal 25%
+
+
+def run_tournaments(char_manager, player_names: List[str], rounds: int,
+                    repetitions: int, workers: Optional[int] = None,
+                    seed: Optional[int] = None, max_rounds: int = 100) -> Dict:
+    """
+    Run many non-interactive tournaments per character across a process pool
+    Run r of every character draws from make_rng(seed, r), so results do not
+    depend on the number of workers. A fresh seed is drawn when none is given.
+    Returns the distribution of rounds survived per character
+    """
+    if rounds < 1:
+        return {"error": "Number of tournament rounds must be at least 1"}
+    if repetitions < 1:
+        return {"error": "Number of repetitions must be at least 1"}
+
+    player_data = {}
+    for name in player_names:
+        player = char_manager.get_character(name)
+        if not player:
+            return {"error": f"Player character '{name}' not found"}
+        player_data[name] = player.to_dict()
+    if seed is None:
+        seed = new_root_seed()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    names = []
+    chunks = []
+    for name in player_data:
+        for start, count in chunk_ranges(repetitions, workers):
+            names.append(name)
+            chunks.append((player_data[name], rounds, start, count, max_rounds, seed))
+
+    survived = {name: Counter() for name in player_data}
+    for name, partial in zip(names, run_chunks(_run_tournament_chunk, chunks, workers)):
+        survived[name].update(partial)
+
+    return {
+        "rounds": rounds,
+        "repetitions": repetitions,
+        "seed": seed,
+        "players": {name: _summarize_survival(counts, rounds, repetitions)
+                    for name, counts in survived.items()},
+    }
+
+
+def _run_tournament_chunk(player_data: Dict, rounds: int, start: int, count: int,
+                          max_rounds: int, seed: int) -> Counter:
+    """Worker entry point: play tournaments start..start+count-1 for one character"""
+    character = Character.from_dict(player_data)
+    simulation = CombatSimulation(None)
+    survived = Counter()
+    for run in range(start, start + count):
+        player = Combatant(character)
+        wins = 0
+        for _, _, result in tournament_rounds(simulation, player, rounds,
+                                              make_rng(seed, run), max_rounds):
+            if result['result'] == CombatResult.VICTORY:
+                wins += 1
+        survived[wins] += 1
+    return survived
+
+
+def _summarize_survival(survived: Counter, rounds: int, repetitions: int) -> Dict:
+    """Turn a rounds-survived counter into the per-character report"""
+    return {
+        "runs": repetitions,
+        "rounds_survived": {wins: survived[wins] for wins in range(rounds + 1)},
+        "mean_rounds_survived": sum(wins * count for wins, count in survived.items()) / repetitions,
+        "champion_rate": survived[rounds] / repetitions,
+    }
@@ -1,30 +1,93 @@
-from typing import List
-from models import Character
-from character_manager import CharacterManager
-from combat_simulation import CombatSimulation
-from character_creation import CharacterCreation
-from game_modes import GameModes
-from ui_helpers import UIHelpers
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from character_manager import CharacterManager
 
 
 class UserInterface:
-    """Interactive command-line interface for the combat simulator"""
+    """
+    Interactive command-line interface for the combat simulator
 
-    def __init__(self):
-        self.char_manager = CharacterManager()
-        self.enemy_manager = CharacterManager()  # Separate manager for enemies
-        self.combat_sim = CombatSimulation(self.char_manager)
-        self.char_creator = CharacterCreation()
-        self.game_modes = GameModes(self.char_manager, self.combat_sim)
-        self.ui = UIHelpers()
+    Subsystems are imported and built the first time they are used, and the
+    save files are loaded on a background thread while the first menu renders.
+    """
 
+    def __init__(self):
         self.save_file_chars = "characters.json"
         self.save_file_enemies = "enemies.json"
 
-        # Try to load existing data
+        # Load existing data in the background; first access to a manager waits
+        self._managers = None
+        self._load_error: Optional[BaseException] = None
+        self._loader = threading.Thread(target=self._load_managers, daemon=True)
+        self._loader.start()
+
+    def _load_managers(self):
+        """Build the journaled managers and load their saved data"""
+        try:
+            from character_manager import CharacterManager
+            from character_storage import JournalStorage
+
+            # Journaled managers: every change is appended to a journal next to
+            # the save file, so saving costs the size of the change, not the roster
+            char_manager = CharacterManager(JournalStorage(self.save_file_chars))
+            enemy_manager = CharacterManager(  # Separate manager for enemies
+                JournalStorage(self.save_file_enemies))
+            self._managers = (char_manager, enemy_manager)
+        except BaseException as e:
+            self._load_error = e
+            return
         self.load_data()
 
-    def list_characters(self, manager: CharacterManager, char_type: str):
+    def _loaded_managers(self):
+        """Wait for the background load and return (characters, enemies)"""
+        if threading.current_thread() is not self._loader:
+            self._loader.join()
+        if self._load_error is not None:
+            raise self._load_error
+        return self._managers
+
+    @property
+    def char_manager(self) -> 'CharacterManager':
+        return self._loaded_managers()[0]
+
+    @property
+    def enemy_manager(self) -> 'CharacterManager':
+        return self._loaded_managers()[1]
+
+    @cached_property
+    def combat_sim(self):
+        from combat_simulation import CombatSimulation
+        return CombatSimulation(self.char_manager)
+
+    @cached_property
+    def char_creator(self):
+        from character_creation import CharacterCreation
+        return CharacterCreation()
+
+    @cached_property
+    def game_modes(self):
+        from game_modes import GameModes
+        return GameModes(self.char_manager, self.combat_sim)
+
+    @cached_property
+    def matchups(self):
+        from matchup import MatchupMatrix
+        return MatchupMatrix(self.char_manager, self.enemy_manager)
+
+    @cached_property
+    def ui(self):
+        from ui_helpers import UIHelpers
+        return UIHelpers()
+
+    def matchup_matrix(self, players: Optional[List[str]] = None,
+                       enemies: Optional[List[str]] = None, trials: int = 1000) -> Dict:
+        """Win rate, mean rounds and mean remaining HP of every player vs every enemy"""
+        return self.matchups.compute(players, enemies, trials)
+
+    def list_characters(self, manager: 'CharacterManager', char_type: str):
         """List all characters"""
         chars = manager.list_characters()
         if not chars:
@@ -37,7 +100,7 @@ class UserInterface:
             print(f"{i}. {char}")
             self.ui.print_separator()
 
-    def edit_character(self, manager: CharacterManager, char_type: str):
+    def edit_character(self, manager: 'CharacterManager', char_type: str):
         """Edit an existing character"""
         chars = manager.list_characters()
         if not chars:
@@ -69,6 +132,7 @@ class UserInterface:
                 char_data = char.to_dict()
                 char_data['name'] = new_name
                 manager.delete_character(char_name)
+                from models import Character
                 manager.characters[new_name] = Character.from_dict(char_data)
                 print("Name updated!")
 
@@ -127,7 +191,7 @@ class UserInterface:
         except (ValueError, IndexError):
             print("Invalid selection!")
 
-    def delete_character(self, manager: CharacterManager, char_type: str):
+    def delete_character(self, manager: 'CharacterManager', char_type: str):
         """Delete a character"""
         chars = manager.list_characters()
         if not chars:
@@ -242,19 +306,19 @@ class UserInterface:
         input("\nPress Enter to continue...")
 
     def save_data(self):
-        """Save characters and enemies to files"""
+        """Make all changes to characters and enemies durable"""
         try:
-            self.char_manager.save_to_file(self.save_file_chars)
-            self.enemy_manager.save_to_file(self.save_file_enemies)
+            self.char_manager.storage.flush()
+            self.enemy_manager.storage.flush()
             print("Data saved successfully!")
         except Exception as e:
             print(f"Error saving data: {e}")
 
     def load_data(self):
-        """Load characters and enemies from files"""
+        """Load characters and enemies from their snapshots and journals"""
         try:
-            self.char_manager.load_from_file(self.save_file_chars)
-            self.enemy_manager.load_from_file(self.save_file_enemies)
+            self.char_manager.load_from_storage()
+            self.enemy_manager.load_from_storage()
         except Exception as e:
             pass  # Silently handle missing files on first run
 
@@ -389,6 +453,8 @@ class UserInterface:
             elif choice == '6':
                 print("\nSaving data before exit...")
                 self.save_data()
+                self.char_manager.storage.close()
+                self.enemy_manager.storage.close()
                 print("Thank you for using Combat Simulator!")
                 break
             else:
@@ -0,0 +1,161 @@
+import numpy as np
+from typing import Dict, List, Optional
+from models import Character, CombatResult
+from combat_engine import HIT_CHANCE_TABLE, HIT_TABLE_OFFSET, damage_table
+
+
+# Result codes stored in the per-fight result array
+VICTORY = 0
+DEFEAT = 1
+ONGOING = 2
+
+RESULT_CODES = {
+    VICTORY: CombatResult.VICTORY,
+    DEFEAT: CombatResult.DEFEAT,
+    ONGOING: CombatResult.ONGOING,
+}
+
+
+def _damage_table_arrays(max_strength: int):
+    """
+    Stack the shared per-STR damage tables into padded 2D arrays
+    Row s holds the cumulative probabilities and damage values for STR s;
+    padding repeats probability 1.0 so it is never selected.
+    """
+    tables = [damage_table(strength) for strength in range(max_strength + 1)]
+    width = max(len(values) for _, values in tables)
+    cumulative = np.ones((max_strength + 1, width))
+    values = np.ones((max_strength + 1, width), dtype=np.int64)
+    for strength, (table_cumulative, table_values) in enumerate(tables):
+        cumulative[strength, :len(table_cumulative)] = table_cumulative
+        values[strength, :len(table_values)] = table_values
+        values[strength, len(table_values):] = table_values[-1]
+    return cumulative, values
+
+
+class VectorizedCombatEngine:
+    """
+    Lockstep combat engine that resolves many independent fights at once
+
+    Every fight is one player (column 0) against the same number of enemies
+    (columns 1..). Stats and combat state are held as (fights, participants)
+    arrays and a whole round is resolved for every fight with batched random
+    draws and masked updates, following the rules of CombatEngine.
+    """
+
+    def __init__(self, strength, dexterity, intelligence, wisdom, agility,
+                 constitution, rng: Optional[np.random.Generator] = None):
+        self.strength = np.asarray(strength, dtype=np.int64)
+        self.dexterity = np.asarray(dexterity, dtype=np.int64)
+        self.agility = np.asarray(agility, dtype=np.int64)
+        self.max_hp = np.asarray(constitution, dtype=np.int64) * 2
+        self.max_mana = np.asarray(intelligence, dtype=np.int64)
+        self.mana_regen = np.maximum(1, np.asarray(wisdom, dtype=np.int64) // 3)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.fights, self.participants = self.max_hp.shape
+        self.current_hp = self.max_hp.copy()
+        self.current_mana = self.max_mana.copy()
+
+        # Lookup tables shared with the scalar CombatEngine
+        self.hit_table = np.array(HIT_CHANCE_TABLE)
+        self.damage_cumulative, self.damage_values = _damage_table_arrays(
+            max(0, int(self.strength.max(initial=0))))
+
+    @classmethod
+    def from_matchup(cls, player: Character, enemies: List[Character], fights: int,
+                     rng: Optional[np.random.Generator] = None) -> 'VectorizedCombatEngine':
+        """Create an engine running the same matchup in every fight"""
+        participants = [player] + list(enemies)
+
+        def column(attr):
+            row = [getattr(char, attr) for char in participants]
+            return np.tile(np.array(row, dtype=np.int64), (fights, 1))
+
+        return cls(column('strength'), column('dexterity'), column('intelligence'),
+                   column('wisdom'), column('agility'), column('constitution'), rng=rng)
+
+    def reset_to_full(self):
+        """Reset HP and mana of every participant in every fight"""
+        np.copyto(self.current_hp, self.max_hp)
+        np.copyto(self.current_mana, self.max_mana)
+
+    def calculate_hit_chance(self, attacker_dex, defender_dex):
+        """Hit chance: 50% + 3% per DEX point of difference, clamped to 5-95%"""
+        index = np.clip(attacker_dex - defender_dex + HIT_TABLE_OFFSET,
+                        0, len(self.hit_table) - 1)
+        return self.hit_table[index]
+
+    def calculate_damage(self, attacker_str):
+        """Damage: 80% to 120% of STR, one uniform draw mapped through the table"""
+        strength = np.maximum(attacker_str, 0)
+        rolls = self.rng.random(strength.shape)
+        index = (self.damage_cumulative[strength] <= rolls[:, None]).sum(axis=1)
+        return self.damage_values[strength, index]
+
+    def simulate(self, max_rounds: int = 100) -> Dict[str, np.ndarray]:
+        """
+        Fight every combat to the end
+        Returns per-fight arrays of result codes, rounds and final player HP
+        """
+        fights = self.fights
+        rows = np.arange(fights)
+        hp = self.current_hp
+        mana = self.current_mana
+
+        result = np.full(fights, ONGOING, dtype=np.int8)
+        rounds = np.full(fights, max_rounds, dtype=np.int64)
+        active = np.ones(fights, dtype=bool)
+
+        for round_count in range(1, max_rounds + 1):
+            # Check win conditions at the start of the round
+            player_dead = hp[:, 0] <= 0
+            enemies_dead = ~(hp[:, 1:] > 0).any(axis=1)
+            ended = active & (player_dead | enemies_dead)
+            result[ended & player_dead] = DEFEAT
+            result[ended & ~player_dead] = VICTORY
+            rounds[ended] = round_count
+            active &= ~ended
+            if not active.any():
+                break
+
+            # Turn order: AGI descending, random tiebreaker within equal AGI
+            order_keys = self.agility + self.rng.random(self.agility.shape)
+            turn_order = np.argsort(-order_keys, axis=1)
+
+            for slot in range(self.participants):
+                actor = turn_order[:, slot]
+                # Fights that ended earlier in this round skip remaining turns
+                still_fighting = (hp[:, 0] > 0) & (hp[:, 1:] > 0).any(axis=1)
+                acting = active & still_fighting & (hp[rows, actor] > 0)
+                if not acting.any():
+                    continue
+
+                # Player attacks a random living enemy, enemies attack the player
+                target = np.zeros(fights, dtype=np.int64)
+                player_turn = acting & (actor == 0)
+                if player_turn.any():
+                    target_keys = self.rng.random((fights, self.participants - 1))
+                    target_keys[hp[:, 1:] <= 0] = -1.0
+                    target = np.where(player_turn, target_keys.argmax(axis=1) + 1, 0)
+
+                hit_chance = self.calculate_hit_chance(
+                    self.dexterity[rows, actor], self.dexterity[rows, target])
+                hits = acting & (self.rng.random(fights) <= hit_chance)
+                damage = self.calculate_damage(self.strength[rows, actor])
+                hp[rows, target] = np.where(
+                    hits, np.maximum(0, hp[rows, target] - damage), hp[rows, target])
+
+                # End-of-turn mana regeneration for living actors
+                regen = acting & (hp[rows, actor] > 0)
+                mana[rows, actor] = np.where(
+                    regen,
+                    np.minimum(self.max_mana[rows, actor],
+                               mana[rows, actor] + self.mana_regen[rows, actor]),
+                    mana[rows, actor])
+
+        return {
+            "result": result,
+            "rounds": rounds,
+            "player_final_hp": hp[:, 0].copy(),
+        }
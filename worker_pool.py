@@ -0,0 +1,40 @@
+import os
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+
+def chunk_ranges(total: int, workers: int, first: int = 0,
+                 chunk_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split items first..first+total-1 into (start, count) chunks
+    By default every worker gets a few chunks, which keeps the pool busy
+    when some chunks happen to take longer than others.
+    """
+    if chunk_size is None:
+        chunk_size = -(-total // (max(1, workers) * 4))
+    return [(start, min(chunk_size, first + total - start))
+            for start in range(first, first + total, chunk_size)]
+
+
+def run_chunks(function: Callable, chunk_args: Sequence[Tuple],
+               workers: Optional[int] = None, executor=None) -> Iterator:
+    """
+    Call function(*args) for every chunk and yield the results in order
+    A single worker runs the chunks in this process. Otherwise they go to
+    executor when given, or to a process pool of their own.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunk_args)))
+
+    if workers == 1:
+        for args in chunk_args:
+            yield function(*args)
+    elif executor is not None:
+        futures = [executor.submit(function, *args) for args in chunk_args]
+        for future in futures:
+            yield future.result()
+    else:
+        # Imported here so processes that never fan out start faster
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from run_chunks(function, chunk_args, workers, executor)